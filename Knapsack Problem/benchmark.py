@@ -0,0 +1,119 @@
+import os
+import time
+import tempfile
+import tracemalloc
+import matplotlib
+matplotlib.use("Agg")  # Write files, no window needed
+import matplotlib.pyplot as plt
+from dynamic import read_input, knapsack_dynamic
+from parallel_dynamic import knapsack_dynamic_vectorized, knapsack_parallel
+from heuristics import critical_item_greedy, greedy_best_item, random_sampler
+from generator import INSTANCE_CLASSES, generate_instance, write_instance
+
+PARALLEL_WORKERS = os.cpu_count() or 1
+
+# Solvers to benchmark, each takes (items, total_items, knapsack_capacity) and returns the best value
+SOLVERS = {
+    "dynamic (pure Python)": lambda items, n, c: knapsack_dynamic(items, n, c),
+    "dynamic (vectorized)": lambda items, n, c: knapsack_dynamic_vectorized(items, n, c),
+    "dynamic (parallel)": lambda items, n, c: knapsack_parallel(items, n, c, PARALLEL_WORKERS),
+    "critical-item greedy": lambda items, n, c: critical_item_greedy(items, n, c)[0],
+    "greedy + best item": lambda items, n, c: greedy_best_item(items, n, c)[0],
+    "random sampler": lambda items, n, c: random_sampler(items, n, c, 1000, seed=0)[0],
+}
+
+# The pure Python dp gets skipped past this many n * C cells, it would take far too long
+PURE_PYTHON_CELL_LIMIT = 5_000_000
+
+# Function to estimate the memory tracemalloc can't see: the parallel dp's shared rows and what its workers allocate
+# Shared buffer 2 * (C + 1) int64s, each worker's copy of the weight and value arrays and its slice-sized temporary.
+# The workers' own interpreters aren't counted, so this is a lower bound.
+def untraced_memory(solver_name, total_items, knapsack_capacity):
+    if solver_name != "dynamic (parallel)":
+        return 0
+    workers = max(1, min(PARALLEL_WORKERS, knapsack_capacity + 1))
+    if workers == 1 or total_items == 0:
+        return 0
+    return 16 * (knapsack_capacity + 1) + workers * 16 * total_items + 8 * (knapsack_capacity + 1)
+
+# Function to time one solver and measure its peak memory, in two separate runs
+# tracemalloc hooks every allocation and slows pure Python code a lot, so it stays off while timing
+def measure(solve, items, total_items, knapsack_capacity, solver_name=None):
+    start_time = time.perf_counter()
+    value = solve(items, total_items, knapsack_capacity)
+    elapsed_time = time.perf_counter() - start_time
+
+    tracemalloc.start()
+    solve(items, total_items, knapsack_capacity)
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    peak_memory += untraced_memory(solver_name, total_items, knapsack_capacity)
+    return value, elapsed_time, peak_memory
+
+# Function to sweep item counts and capacities for one class, the instances go through the file format
+def run_sweep(instance_class, item_counts, capacities, solvers=None, data_range=1000, seed=42):
+    if solvers is None:
+        solvers = list(SOLVERS)
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for total_items in item_counts:
+            for capacity in capacities:
+                filename = os.path.join(tmp_dir, f"{instance_class}_{total_items}_{capacity}")
+                write_instance(filename, *generate_instance(instance_class, total_items, data_range, capacity, seed=seed))
+                knapsack_capacity, total_items, items = read_input(filename)
+                for solver_name in solvers:
+                    if solver_name == "dynamic (pure Python)" and total_items * knapsack_capacity > PURE_PYTHON_CELL_LIMIT:
+                        continue
+                    value, elapsed_time, peak_memory = measure(SOLVERS[solver_name], items, total_items, knapsack_capacity, solver_name)
+                    results.append({
+                        "class": instance_class, "solver": solver_name, "items": total_items,
+                        "capacity": knapsack_capacity, "value": value, "time": elapsed_time, "memory": peak_memory,
+                    })
+                    print("%-28s %-22s n=%-7d C=%-9d value=%-10d %.3f s %.1f MB" % (
+                        instance_class, solver_name, total_items, knapsack_capacity, value, elapsed_time, peak_memory / 2 ** 20))
+    return results
+
+# Function to plot time and memory against n (at the largest capacity) and against C (at the largest n)
+def plot_results(results, output_file):
+    classes = sorted({r["class"] for r in results})
+    fig, axes = plt.subplots(len(classes), 4, figsize=(24, 5 * len(classes)), squeeze=False)
+    for row, instance_class in enumerate(classes):
+        class_results = [r for r in results if r["class"] == instance_class]
+        largest_capacity = max(r["capacity"] for r in class_results)
+        largest_items = max(r["items"] for r in class_results)
+        panels = [
+            ("items", "time", [r for r in class_results if r["capacity"] == largest_capacity], "Time (s)"),
+            ("items", "memory", [r for r in class_results if r["capacity"] == largest_capacity], "Peak memory (bytes)"),
+            ("capacity", "time", [r for r in class_results if r["items"] == largest_items], "Time (s)"),
+            ("capacity", "memory", [r for r in class_results if r["items"] == largest_items], "Peak memory (bytes)"),
+        ]
+        for col, (x_key, y_key, panel_results, y_label) in enumerate(panels):
+            ax = axes[row][col]
+            for solver_name in sorted({r["solver"] for r in panel_results}):
+                points = sorted((r[x_key], r[y_key]) for r in panel_results if r["solver"] == solver_name)
+                ax.plot([p[0] for p in points], [p[1] for p in points], marker='o', label=solver_name)
+            ax.set_xscale('log')
+            ax.set_yscale('log')
+            ax.set_title(f"{instance_class}: {y_key} vs {x_key}")
+            ax.set_xlabel('Items' if x_key == "items" else 'Capacity')
+            ax.set_ylabel(y_label)
+            ax.legend(loc='best', fontsize=8)
+            ax.grid(True)
+    fig.tight_layout()
+    fig.savefig(output_file)
+    plt.close(fig)
+
+# Main program
+if __name__ == "__main__":
+    print("Classes:", ", ".join(INSTANCE_CLASSES))
+    classes = input("Enter classes (comma separated, empty for all): ").strip()
+    classes = [c.strip() for c in classes.split(",")] if classes else INSTANCE_CLASSES
+    item_counts = [int(n) for n in (input("Enter item counts (default 100,1000,10000): ") or "100,1000,10000").split(",")]
+    capacities = [int(c) for c in (input("Enter capacities (default 10000,100000,1000000): ") or "10000,100000,1000000").split(",")]
+    output_file = input("Enter output image (default benchmark.png): ").strip() or "benchmark.png"
+
+    results = []
+    for instance_class in classes:
+        results.extend(run_sweep(instance_class, item_counts, capacities))
+    plot_results(results, output_file)
+    print(f"Saved plot to {output_file}")
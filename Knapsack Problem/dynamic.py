@@ -1,22 +1,32 @@
 import time 
 from tqdm import tqdm
 
-# Classify items with their values and weights
+# Classify items with their values and weights (count and volume are only used by the variants)
 class item:
-    def __init__(self, value, weight):
+    def __init__(self, value, weight, count=1, volume=0):
         self.value = value
         self.weight = weight
+        self.count = count  # How many copies of the item are available
+        self.volume = volume  # Second constraint, 0 when the file has no volume column
 
 # Function to read input data from a file
-def read_input(filename):
+# Item lines are "weight value [count [volume]]", the first line may carry a volume capacity as a third number
+def read_input(filename, with_volume_capacity=False):
     items = []  # initialize an empty list to store items
     with open(filename, 'r') as file:
         # Read knapsack capacity and total number of items from the first line
-        knapsack_capacity, total_items = map(int, file.readline().split())
-        # Read each item's weight and value
+        header = list(map(int, file.readline().split()))
+        knapsack_capacity, total_items = header[0], header[1]
+        volume_capacity = header[2] if len(header) > 2 else 0
+        # Read each item's weight and value, plus the optional columns
         for _ in range(total_items):
-            weight, value = map(int, file.readline().split())
-            items.append(item(value, weight))  # Create item obkects and add them to the list
+            parts = list(map(int, file.readline().split()))
+            weight, value = parts[0], parts[1]
+            count = parts[2] if len(parts) > 2 else 1
+            volume = parts[3] if len(parts) > 3 else 0
+            items.append(item(value, weight, count, volume))  # Create item obkects and add them to the list
+    if with_volume_capacity:
+        return knapsack_capacity, volume_capacity, total_items, items
     return knapsack_capacity, total_items, items  # Return the parsed data
 
 # Function to solve the knapsack problem with dynamic programming
@@ -32,6 +42,9 @@ def knapsack_dynamic(items, total_items, knapsack_capacity):
             if items[n].weight <= k:
                 # Update the value in dp2 based on whether the current item is included or not
                 dp2[k] = max(dp1[k], dp1[k - items[n].weight] + items[n].value)
+            else:
+                # Item doesn't fit, carry the previous row over (dp2 still holds values from two items ago)
+                dp2[k] = dp1[k]
         # Update the dp1 and dp2 arrays for the next iteration
         dp1, dp2 = dp2, dp1
 
@@ -0,0 +1,54 @@
+import numpy as np
+
+# Pisinger's standard difficulty classes
+INSTANCE_CLASSES = ["uncorrelated", "weakly_correlated", "strongly_correlated", "inverse_strongly_correlated", "subset_sum"]
+
+# Function to generate item weights and values for one difficulty class (data range 1..data_range)
+def generate_items(instance_class, total_items, data_range=1000, seed=None):
+    rng = np.random.default_rng(seed)
+    spread = max(1, data_range // 10)
+    if instance_class == "uncorrelated":
+        weights = rng.integers(1, data_range + 1, total_items)
+        values = rng.integers(1, data_range + 1, total_items)
+    elif instance_class == "weakly_correlated":
+        weights = rng.integers(1, data_range + 1, total_items)
+        values = np.maximum(1, weights + rng.integers(-spread, spread + 1, total_items))
+    elif instance_class == "strongly_correlated":
+        weights = rng.integers(1, data_range + 1, total_items)
+        values = weights + spread
+    elif instance_class == "inverse_strongly_correlated":
+        values = rng.integers(1, data_range + 1, total_items)
+        weights = values + spread
+    elif instance_class == "subset_sum":
+        weights = rng.integers(1, data_range + 1, total_items)
+        values = weights.copy()
+    else:
+        raise ValueError(f"Unknown instance class {instance_class!r}, expected one of {INSTANCE_CLASSES}")
+    return weights.astype(np.int64), values.astype(np.int64)
+
+# Function to generate a whole instance, capacity is a fraction of the total weight unless given
+def generate_instance(instance_class, total_items, data_range=1000, capacity=None, capacity_ratio=0.5, seed=None):
+    weights, values = generate_items(instance_class, total_items, data_range, seed)
+    if capacity is None:
+        capacity = max(1, int(weights.sum() * capacity_ratio))
+    return capacity, weights, values
+
+# Function to write an instance in the dataset format ("capacity n" then "weight value" per line)
+def write_instance(filename, capacity, weights, values):
+    with open(filename, 'w') as file:
+        file.write(f"{capacity}\t{len(weights)}\n")
+        file.writelines(f"{w}\t{v}\n" for w, v in zip(weights.tolist(), values.tolist()))
+
+# Main program
+if __name__ == "__main__":
+    print("Classes:", ", ".join(INSTANCE_CLASSES))
+    instance_class = input("Enter instance class: ").strip()
+    total_items = int(input("Enter number of items: "))
+    data_range = int(input("Enter data range (default 1000): ") or 1000)
+    capacity = input("Enter capacity (leave empty for half the total weight): ").strip()
+    seed = int(input("Enter seed (default 42): ") or 42)
+    filename = input("Enter output filename: ").strip()
+
+    capacity, weights, values = generate_instance(instance_class, total_items, data_range, int(capacity) if capacity else None, seed=seed)
+    write_instance(filename, capacity, weights, values)
+    print(f"Wrote {total_items} items with capacity {capacity} to {filename}")
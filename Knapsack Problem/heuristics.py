@@ -0,0 +1,145 @@
+import time
+import numpy as np
+from dynamic import read_input
+from parallel_dynamic import items_to_arrays, knapsack_dynamic_vectorized
+
+# Function to fill the knapsack in the given order, skipping items that don't fit (like greedy.c)
+def fill_in_order(weights, values, order, knapsack_capacity):
+    knapsack_weight = 0
+    knapsack_value = 0
+    selected = []
+    for i in order:
+        if knapsack_weight + weights[i] <= knapsack_capacity:
+            knapsack_weight += int(weights[i])
+            knapsack_value += int(values[i])
+            selected.append(int(i))
+    return knapsack_value, selected
+
+# Greedy by value-to-weight ratio with a full sort, same result as greedy.c
+def greedy_sorted(items, total_items, knapsack_capacity):
+    weights, values = items_to_arrays(items, total_items)
+    ratios = values / np.maximum(weights, 1)
+    order = np.argsort(-ratios, kind='stable')
+    return fill_in_order(weights, values, order, knapsack_capacity)
+
+# Function to find the critical (break) item in O(n) by repeated median-of-ratios partitioning (Balas-Zemel)
+def find_critical_ratio(weights, ratios, knapsack_capacity):
+    candidates = np.arange(len(weights))
+    remaining = knapsack_capacity
+    taken = []  # Index arrays of item groups that fit entirely
+
+    while len(candidates) > 0:
+        cand_ratios = ratios[candidates]
+        # np.partition is an O(n) selection, no full sort needed
+        median = np.partition(cand_ratios, len(cand_ratios) // 2)[len(cand_ratios) // 2]
+        high = candidates[cand_ratios > median]
+        equal = candidates[cand_ratios == median]
+        low = candidates[cand_ratios < median]
+
+        high_weight = int(weights[high].sum())
+        if high_weight > remaining:
+            # The critical item is among the better ones
+            candidates = high
+            continue
+        taken.append(high)
+        remaining -= high_weight
+
+        equal_weight = int(weights[equal].sum())
+        if equal_weight <= remaining:
+            # Everything at the median ratio fits too, keep looking among the worse ones
+            taken.append(equal)
+            remaining -= equal_weight
+            candidates = low
+            continue
+
+        # The critical item has the median ratio, take equal items until one doesn't fit
+        fits = np.cumsum(weights[equal]) <= remaining
+        cut = int(np.argmin(fits))  # First one that doesn't fit
+        taken.append(equal[:cut])
+        remaining -= int(weights[equal[:cut]].sum())
+        return np.concatenate(taken), median, remaining
+
+    # Every item fits
+    return (np.concatenate(taken) if taken else candidates), None, remaining
+
+# Linear-time critical-item greedy: break solution plus a pass over the leftover items
+def critical_item_greedy(items, total_items, knapsack_capacity):
+    weights, values = items_to_arrays(items, total_items)
+    ratios = values / np.maximum(weights, 1)
+    taken, critical_ratio, remaining = find_critical_ratio(weights, ratios, knapsack_capacity)
+
+    selected = np.zeros(total_items, dtype=bool)
+    selected[taken] = True
+    knapsack_value = int(values[taken].sum())
+    if critical_ratio is not None:
+        # Fill the leftover capacity with whatever still fits, in input order (no sort)
+        for i in np.flatnonzero(~selected):
+            if weights[i] <= remaining:
+                remaining -= int(weights[i])
+                knapsack_value += int(values[i])
+                selected[i] = True
+    return knapsack_value, [int(i) for i in np.flatnonzero(selected)]
+
+# Greedy plus the best single item that fits, guarantees at least half of the optimum
+def greedy_best_item(items, total_items, knapsack_capacity):
+    weights, values = items_to_arrays(items, total_items)
+    greedy_value, greedy_selected = critical_item_greedy(items, total_items, knapsack_capacity)
+    fitting = np.flatnonzero(weights <= knapsack_capacity)
+    if len(fitting) == 0:
+        return greedy_value, greedy_selected
+    best = int(fitting[np.argmax(values[fitting])])
+    if int(values[best]) > greedy_value:
+        return int(values[best]), [best]
+    return greedy_value, greedy_selected
+
+# Batched random sampler: scores many random fills at once (random order, stop at the first item that doesn't fit)
+def random_sampler(items, total_items, knapsack_capacity, samples=1000, seed=None, batch_size=None):
+    weights, values = items_to_arrays(items, total_items)
+    rng = np.random.default_rng(seed)
+    if batch_size is None:
+        # Keep each batch around a few million cells so the memory stays bounded
+        batch_size = max(1, min(samples, 4_000_000 // max(total_items, 1)))
+
+    best_value = 0
+    best_selected = []
+    done = 0
+    while done < samples:
+        batch = min(batch_size, samples - done)
+        # One random permutation per row
+        orders = np.argsort(rng.random((batch, total_items)), axis=1)
+        fits = np.cumsum(weights[orders], axis=1) <= knapsack_capacity
+        scores = np.where(fits, values[orders], 0).sum(axis=1)
+        row = int(np.argmax(scores))
+        if scores[row] > best_value:
+            best_value = int(scores[row])
+            best_selected = sorted(int(i) for i in orders[row][fits[row]])
+        done += batch
+    return best_value, best_selected
+
+# Main program, runs every heuristic and the dp on the same file
+if __name__ == "__main__":
+    filename = input("Enter filename: ")
+    samples = int(input("Enter number of random samples: ") or 1000)
+
+    knapsack_capacity, total_items, items = read_input(filename)
+    print("Knapsack capacity:", knapsack_capacity)
+    print("Total number of items:", total_items)
+
+    solvers = [
+        ("Greedy (sorted)", lambda: greedy_sorted(items, total_items, knapsack_capacity)[0]),
+        ("Critical-item greedy", lambda: critical_item_greedy(items, total_items, knapsack_capacity)[0]),
+        ("Greedy + best item", lambda: greedy_best_item(items, total_items, knapsack_capacity)[0]),
+        ("Random sampler", lambda: random_sampler(items, total_items, knapsack_capacity, samples)[0]),
+        ("Dynamic programming", lambda: knapsack_dynamic_vectorized(items, total_items, knapsack_capacity)),
+    ]
+    results = []
+    for solver_name, solve in solvers:
+        start_time = time.time()
+        value = solve()
+        elapsed_time = time.time() - start_time
+        results.append((solver_name, value, elapsed_time))
+
+    optimum = results[-1][1]
+    for solver_name, value, elapsed_time in results:
+        gap = (optimum - value) / optimum * 100 if optimum else 0.0
+        print("%-22s value: %-12d gap: %6.2f%%  time: %.2f ms" % (solver_name, value, gap, elapsed_time * 1000))
@@ -0,0 +1,161 @@
+import time
+import numpy as np
+from dynamic import item, read_input
+from parallel_dynamic import dp_update_slice
+
+# Function to run the 0/1 dp for a list of items starting from an existing row
+def apply_items(row, items):
+    prev = row.copy()
+    cur = np.empty_like(row)
+    for it in items:
+        dp_update_slice(prev, cur, it.weight, it.value, 0, len(row))
+        prev, cur = cur, prev
+    return prev
+
+# Knapsack solver that keeps dp rows every few items so changes don't start over from item 0
+# Appends cost O(m * C) for m new items. A removal reprocesses every item from the last checkpoint before the
+# removed one, O((n - first) * C), so removals near the front cost about a full solve. Only the offline
+# knapsack_timeline below gets O(C log T) per change.
+class IncrementalKnapsack:
+    # Each checkpoint is one dp row (knapsack_capacity + 1 int64s), so pick checkpoint_every with memory in mind
+    def __init__(self, knapsack_capacity, checkpoint_every=256):
+        self.knapsack_capacity = knapsack_capacity
+        self.checkpoint_every = checkpoint_every
+        self.items = []
+        # checkpoints[j] is the dp row after the first j items, j a multiple of checkpoint_every
+        self.checkpoints = {0: np.zeros(knapsack_capacity + 1, dtype=np.int64)}
+        self.row = self.checkpoints[0]
+        self.last_update_items = 0  # Items reprocessed by the last update, a direct measure of its cost
+
+    # Function to process items[start:] on top of the given row, saving checkpoints on the way
+    def _recompute_from(self, start, row):
+        k = self.checkpoint_every
+        position = start
+        while position < len(self.items):
+            # Run up to the next checkpoint boundary in one go
+            stop = min(len(self.items), (position // k + 1) * k)
+            row = apply_items(row, self.items[position:stop])
+            position = stop
+            if position % k == 0:
+                self.checkpoints[position] = row
+        self.last_update_items = len(self.items) - start
+        self.row = row
+
+    # Append items, only the new tail gets processed
+    def add_items(self, new_items):
+        start = len(self.items)
+        self.items.extend(new_items)
+        self._recompute_from(start, self.row)
+
+    # Remove items by position, recomputes from the last checkpoint before the first removed one
+    def remove_items(self, positions):
+        if not positions:
+            return
+        for position in positions:
+            if not 0 <= position < len(self.items):
+                raise IndexError(f"Item position {position} out of range, there are {len(self.items)} items")
+        removed = set(positions)
+        first = min(removed)
+        self.items = [it for i, it in enumerate(self.items) if i not in removed]
+        # Checkpoints past the first removed position are stale now
+        self.checkpoints = {j: row for j, row in self.checkpoints.items() if j <= first}
+        start = max(self.checkpoints)
+        self._recompute_from(start, self.checkpoints[start])
+
+    # Best value with capacity at most the given one (defaults to the full capacity)
+    def best_value(self, capacity=None):
+        if capacity is None:
+            capacity = self.knapsack_capacity
+        if capacity < 0:
+            return 0
+        if capacity > self.knapsack_capacity:
+            raise ValueError(f"Capacity {capacity} exceeds the solved capacity {self.knapsack_capacity}")
+        return int(self.row[capacity])
+
+# Offline solver for a timeline of additions and removals (segment tree over time)
+# operations is a list of ("add", key, item) and ("remove", key), returns the best value after each operation.
+# Every item lands in O(log T) tree nodes, so each change costs O(C log T) however early the item was added.
+def knapsack_timeline(knapsack_capacity, operations):
+    total_ops = len(operations)
+    if total_ops == 0:
+        return []
+
+    # Work out the interval [added, removed) each item is present for
+    intervals = []
+    active = {}
+    for t, operation in enumerate(operations):
+        if operation[0] == "add":
+            if operation[1] in active:
+                raise ValueError(f"Item {operation[1]!r} added twice without being removed")
+            active[operation[1]] = (t, operation[2])
+        elif operation[0] == "remove":
+            if operation[1] not in active:
+                raise ValueError(f"Item {operation[1]!r} removed but not present")
+            start, it = active.pop(operation[1])
+            intervals.append((start, t, it))
+        else:
+            raise ValueError(f"Unknown operation {operation[0]!r}")
+    for start, it in active.values():
+        intervals.append((start, total_ops, it))
+
+    # Place each interval on the O(log T) nodes that cover it
+    node_items = {}
+    def insert(node, lo, hi, start, stop, it):
+        if stop <= lo or hi <= start:
+            return
+        if start <= lo and hi <= stop:
+            node_items.setdefault(node, []).append(it)
+            return
+        mid = (lo + hi) // 2
+        insert(2 * node, lo, mid, start, stop, it)
+        insert(2 * node + 1, mid, hi, start, stop, it)
+    for start, stop, it in intervals:
+        insert(1, 0, total_ops, start, stop, it)
+
+    # Walk the tree, each node applies its items on top of its parent's row
+    answers = [0] * total_ops
+    stack = [(1, 0, total_ops, np.zeros(knapsack_capacity + 1, dtype=np.int64))]
+    while stack:
+        node, lo, hi, row = stack.pop()
+        if node in node_items:
+            row = apply_items(row, node_items[node])
+        if hi - lo == 1:
+            answers[lo] = int(row[knapsack_capacity])
+            continue
+        mid = (lo + hi) // 2
+        stack.append((2 * node + 1, mid, hi, row))
+        stack.append((2 * node, lo, mid, row))
+    return answers
+
+# Main program, solves a file then appends / removes items interactively
+if __name__ == "__main__":
+    filename = input("Enter filename: ")
+    knapsack_capacity, total_items, items = read_input(filename)
+    print("Knapsack capacity:", knapsack_capacity)
+    print("Total number of items:", total_items)
+
+    start_time = time.time()
+    solver = IncrementalKnapsack(knapsack_capacity)
+    solver.add_items(items)
+    print("Maximum value:", solver.best_value())
+    print("Initial solve took %.2f seconds." % (time.time() - start_time))
+
+    # Commands: "add <weight> <value>", "remove <position>", empty line to quit
+    while True:
+        command = input("Command (add <weight> <value> / remove <position>, empty to quit): ").split()
+        if not command:
+            break
+        start_time = time.time()
+        if command[0] == "add" and len(command) == 3:
+            solver.add_items([item(int(command[2]), int(command[1]))])
+        elif command[0] == "remove" and len(command) == 2:
+            try:
+                solver.remove_items([int(command[1])])
+            except IndexError as error:
+                print(error)
+                continue
+        else:
+            print("Unknown command.")
+            continue
+        print("Maximum value:", solver.best_value())
+        print("Update reprocessed %d items in %.2f ms." % (solver.last_update_items, (time.time() - start_time) * 1000))
@@ -0,0 +1,104 @@
+import os
+import time
+import hashlib
+import numpy as np
+from dynamic import read_input
+from parallel_dynamic import knapsack_parallel_profile
+
+# Solver that runs the DP once and answers capacity / value queries from the final dp row
+class KnapsackSolver:
+    def __init__(self, items, total_items, knapsack_capacity, workers=1, cache_dir=None, key=None):
+        self.items = items
+        self.total_items = total_items
+        self.knapsack_capacity = knapsack_capacity
+        self.workers = workers
+        self.cache_dir = cache_dir
+        # Key for the on-disk cache, hash of the dataset if not given
+        self.key = key if key is not None else hash_items(items, total_items)
+        self.profile = None
+
+    # Build a solver straight from a dataset file, capacity defaults to the one in the file
+    @classmethod
+    def from_file(cls, filename, knapsack_capacity=None, workers=1, cache_dir=None):
+        file_capacity, total_items, items = read_input(filename)
+        if knapsack_capacity is None:
+            knapsack_capacity = file_capacity
+        return cls(items, total_items, knapsack_capacity, workers, cache_dir, hash_items(items, total_items))
+
+    # Path of the cached profile for this dataset
+    def cache_path(self):
+        return os.path.join(self.cache_dir, f"{self.key}.npy")
+
+    # Run the DP (or load it from the cache) the first time it's needed
+    def solve(self):
+        if self.profile is not None:
+            return self.profile
+
+        if self.cache_dir is not None and os.path.exists(self.cache_path()):
+            # Memory-map the cached profile, reuse it if it covers the requested capacity
+            cached = np.load(self.cache_path(), mmap_mode='r')
+            if len(cached) - 1 >= self.knapsack_capacity:
+                self.profile = cached
+                return self.profile
+
+        profile = knapsack_parallel_profile(self.items, self.total_items, self.knapsack_capacity, self.workers)
+
+        if self.cache_dir is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write to a temp file and rename so a half-written cache never gets loaded
+            tmp_path = self.cache_path() + f".{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as file:
+                np.save(file, profile)
+            os.replace(tmp_path, self.cache_path())
+            profile = np.load(self.cache_path(), mmap_mode='r')
+
+        self.profile = profile
+        return self.profile
+
+    # Best value reachable with capacity at most the given one, O(1) after the first solve
+    def best_value(self, capacity):
+        if capacity < 0:
+            return 0
+        if capacity > self.knapsack_capacity:
+            raise ValueError(f"Capacity {capacity} exceeds the solved capacity {self.knapsack_capacity}")
+        return int(self.solve()[capacity])
+
+    # Smallest capacity whose best value reaches the target, None if it can't be reached
+    def min_capacity(self, target_value):
+        profile = self.solve()
+        # The profile never decreases with capacity, so binary search works
+        capacity = int(np.searchsorted(profile, target_value, side='left'))
+        if capacity > self.knapsack_capacity:
+            return None
+        return capacity
+
+# Function to hash the items of a dataset (weight/value pairs in order)
+def hash_items(items, total_items):
+    data = np.array([(items[n].weight, items[n].value) for n in range(total_items)], dtype=np.int64)
+    return hashlib.sha256(data.tobytes()).hexdigest()
+
+# Main program
+if __name__ == "__main__":
+    filename = input("Enter filename: ")
+    cache_dir = input("Enter cache directory (leave empty for no cache): ").strip() or None
+
+    start_time = time.time()
+    solver = KnapsackSolver.from_file(filename, cache_dir=cache_dir)
+    solver.solve()
+    print("Knapsack capacity:", solver.knapsack_capacity)
+    print("Total number of items:", solver.total_items)
+    print("Profile ready in %.2f seconds." % (time.time() - start_time))
+
+    # Answer queries until an empty line, "c <capacity>" or "v <value>"
+    while True:
+        query = input("Query (c <capacity> / v <value>, empty to quit): ").split()
+        if not query:
+            break
+        if len(query) != 2 or query[0] not in ("c", "v"):
+            print("Unknown query.")
+            continue
+        if query[0] == "c":
+            print("Maximum value:", solver.best_value(int(query[1])))
+        else:
+            capacity = solver.min_capacity(int(query[1]))
+            print("Minimum capacity:", capacity if capacity is not None else "unreachable")
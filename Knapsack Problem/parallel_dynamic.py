@@ -0,0 +1,140 @@
+import time
+import threading
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from multiprocessing.connection import wait
+import numpy as np
+from dynamic import read_input
+
+BARRIER_TIMEOUT = 300  # Seconds a worker waits for the others on one item before giving up
+
+# Function to turn the list of item objects into weight and value arrays
+def items_to_arrays(items, total_items):
+    weights = np.fromiter((items[n].weight for n in range(total_items)), dtype=np.int64, count=total_items)
+    values = np.fromiter((items[n].value for n in range(total_items)), dtype=np.int64, count=total_items)
+    return weights, values
+
+# Update one slice [lo, hi) of the current row from the previous row for a single item
+def dp_update_slice(prev, cur, weight, value, lo, hi):
+    # Capacities below the item weight can't take the item, so they just copy the previous row
+    split = min(max(lo, weight), hi)
+    cur[lo:split] = prev[lo:split]
+    if split < hi:
+        # prev[k - weight] may live in another worker's slice, that's fine since prev is read-only here
+        np.maximum(prev[split:hi], prev[split - weight:hi - weight] + value, out=cur[split:hi])
+
+# Vectorized serial engine, returns the whole final dp row (best value for every capacity)
+def knapsack_dynamic_profile(items, total_items, knapsack_capacity):
+    weights, values = items_to_arrays(items, total_items)
+    prev = np.zeros(knapsack_capacity + 1, dtype=np.int64)  # Previous row
+    cur = np.zeros(knapsack_capacity + 1, dtype=np.int64)  # Current row
+    for n in range(total_items):
+        dp_update_slice(prev, cur, int(weights[n]), int(values[n]), 0, knapsack_capacity + 1)
+        prev, cur = cur, prev
+    return prev
+
+# Vectorized serial engine, same answer as knapsack_dynamic
+def knapsack_dynamic_vectorized(items, total_items, knapsack_capacity):
+    return int(knapsack_dynamic_profile(items, total_items, knapsack_capacity)[knapsack_capacity])
+
+# Worker process: owns the capacities [lo, hi) of both rows in the shared buffer
+def _worker(shm_name, knapsack_capacity, weights, values, lo, hi, barrier):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    rows = prev = cur = None
+    try:
+        rows = np.ndarray((2, knapsack_capacity + 1), dtype=np.int64, buffer=shm.buf)
+        for n in range(len(weights)):
+            # Row n % 2 is the previous row, the other one gets written
+            prev, cur = rows[n % 2], rows[(n + 1) % 2]
+            dp_update_slice(prev, cur, int(weights[n]), int(values[n]), lo, hi)
+            # Wait for every slice to finish this item before anyone reads the new row
+            barrier.wait(BARRIER_TIMEOUT)
+    except threading.BrokenBarrierError:
+        # Another worker died (the parent aborted the barrier) or hung, give up instead of waiting forever
+        raise SystemExit(1)
+    finally:
+        del rows, prev, cur  # Drop the views so the shared memory can be closed
+        shm.close()
+
+# Function to split the capacity range into contiguous slices, one per worker
+def partition_capacity(knapsack_capacity, workers):
+    bounds = np.linspace(0, knapsack_capacity + 1, workers + 1).astype(np.int64)
+    return [(int(bounds[i]), int(bounds[i + 1])) for i in range(workers)]
+
+# Function to solve the knapsack problem with the capacity range split across worker processes
+def knapsack_parallel_profile(items, total_items, knapsack_capacity, workers):
+    workers = max(1, min(workers, knapsack_capacity + 1))
+    if workers == 1 or total_items == 0:
+        return knapsack_dynamic_profile(items, total_items, knapsack_capacity)
+
+    weights, values = items_to_arrays(items, total_items)
+    shm = shared_memory.SharedMemory(create=True, size=2 * (knapsack_capacity + 1) * 8)
+    try:
+        rows = np.ndarray((2, knapsack_capacity + 1), dtype=np.int64, buffer=shm.buf)
+        rows[:] = 0
+        barrier = mp.Barrier(workers)
+        processes = []
+        for lo, hi in partition_capacity(knapsack_capacity, workers):
+            p = mp.Process(target=_worker, args=(shm.name, knapsack_capacity, weights, values, lo, hi, barrier))
+            p.start()
+            processes.append(p)
+        # Wait for the workers, if one fails break the barrier so the others stop instead of hanging
+        running = list(processes)
+        while running:
+            wait([p.sentinel for p in running])
+            for p in [p for p in running if not p.is_alive()]:
+                running.remove(p)
+                if p.exitcode != 0:
+                    barrier.abort()
+        for p in processes:
+            if p.exitcode != 0:
+                raise RuntimeError(f"Worker process exited with code {p.exitcode}")
+        # After the last item the result sits in row total_items % 2
+        profile = rows[total_items % 2].copy()
+        del rows
+    finally:
+        shm.close()
+        shm.unlink()
+    return profile
+
+def knapsack_parallel(items, total_items, knapsack_capacity, workers):
+    return int(knapsack_parallel_profile(items, total_items, knapsack_capacity, workers)[knapsack_capacity])
+
+# Function to time the serial and parallel engines and report speedup and parallel efficiency
+def parallel_report(items, total_items, knapsack_capacity, workers):
+    start_time = time.time()
+    serial_value = knapsack_dynamic_vectorized(items, total_items, knapsack_capacity)
+    serial_time = time.time() - start_time
+
+    start_time = time.time()
+    parallel_value = knapsack_parallel(items, total_items, knapsack_capacity, workers)
+    parallel_time = time.time() - start_time
+
+    speedup = serial_time / parallel_time if parallel_time > 0 else float('inf')
+    efficiency = speedup / workers
+    return {
+        "serial_value": serial_value,
+        "parallel_value": parallel_value,
+        "serial_time": serial_time,
+        "parallel_time": parallel_time,
+        "speedup": speedup,
+        "efficiency": efficiency,
+    }
+
+# Main program
+if __name__ == "__main__":
+    filename = input("Enter filename: ")
+    workers = int(input("Enter number of workers: ") or mp.cpu_count())
+
+    knapsack_capacity, total_items, items = read_input(filename)
+    print("Knapsack capacity:", knapsack_capacity)
+    print("Total number of items:", total_items)
+    print("Workers:", workers)
+
+    report = parallel_report(items, total_items, knapsack_capacity, workers)
+    print("Maximum value (serial):", report["serial_value"])
+    print("Maximum value (parallel):", report["parallel_value"])
+    if report["serial_value"] != report["parallel_value"]:
+        print("Warning: serial and parallel engines disagree!")
+    print("Serial time: %.2f seconds, parallel time: %.2f seconds" % (report["serial_time"], report["parallel_time"]))
+    print("Speedup: %.2fx, parallel efficiency: %.1f%%" % (report["speedup"], report["efficiency"] * 100))
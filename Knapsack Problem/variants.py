@@ -0,0 +1,141 @@
+import time
+import numpy as np
+from dynamic import item, read_input
+from parallel_dynamic import knapsack_dynamic_vectorized
+
+NEG_INF = -(2 ** 62)  # Marks unreachable states in the int64 tables
+
+# Function to split items with a count into 0/1 pieces of 1, 2, 4, ... copies (binary splitting)
+def binary_split(items, total_items):
+    pieces = []
+    for n in range(total_items):
+        remaining = items[n].count
+        size = 1
+        while remaining > 0:
+            take = min(size, remaining)
+            pieces.append(item(items[n].value * take, items[n].weight * take, 1, items[n].volume * take))
+            remaining -= take
+            size *= 2
+    return pieces
+
+# Bounded knapsack via binary splitting, O(C * sum(log count)) instead of O(C * sum(count))
+def bounded_knapsack_binary(items, total_items, knapsack_capacity):
+    pieces = binary_split(items, total_items)
+    return knapsack_dynamic_vectorized(pieces, len(pieces), knapsack_capacity)
+
+# Function to take the max over a sliding window of k rows (row j covers rows j-k+1..j)
+# Van Herk / Gil-Werman: block prefix and suffix maxima, O(1) per cell and fully vectorized
+def sliding_window_max(a, k):
+    rows, cols = a.shape
+    k = min(k, rows)
+    padded_rows = -(-(rows + k - 1) // k) * k
+    b = np.full((padded_rows, cols), NEG_INF, dtype=a.dtype)
+    b[k - 1:k - 1 + rows] = a
+    blocks = b.reshape(-1, k, cols)
+    prefix = np.maximum.accumulate(blocks, axis=1).reshape(padded_rows, cols)
+    suffix = np.maximum.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].reshape(padded_rows, cols)
+    return np.maximum(suffix[:rows], prefix[k - 1:k - 1 + rows])
+
+# Bounded knapsack via the monotone-queue recurrence, O(n * C) no matter how large the counts are
+def bounded_knapsack_queue(items, total_items, knapsack_capacity):
+    dp = np.zeros(knapsack_capacity + 1, dtype=np.int64)
+    for n in range(total_items):
+        weight, value, count = items[n].weight, items[n].value, items[n].count
+        if count <= 0 or weight > knapsack_capacity:
+            continue
+        if weight == 0:
+            dp += value * count
+            continue
+        # Lay dp out as a grid where column r holds capacities r, r + w, r + 2w, ...
+        rows = knapsack_capacity // weight + 1
+        grid = np.full(rows * weight, NEG_INF, dtype=np.int64)
+        grid[:knapsack_capacity + 1] = dp
+        grid = grid.reshape(rows, weight)
+        # dp'[r + jw] = max over t in [j - count, j] of dp[r + tw] - t*v, plus j*v
+        shift = np.arange(rows, dtype=np.int64)[:, None] * value
+        best = sliding_window_max(np.where(grid > NEG_INF, grid - shift, NEG_INF), count + 1) + shift
+        dp = best.reshape(-1)[:knapsack_capacity + 1]
+    return int(dp[knapsack_capacity])
+
+# Two-constraint knapsack with a dense (weight x volume) table
+def knapsack_2d_dense(items, total_items, knapsack_capacity, volume_capacity):
+    total_value = sum(items[n].value for n in range(total_items))
+    # Smallest integer type that holds any reachable value, keeps the table compact
+    dtype = np.int32 if total_value < 2 ** 31 else np.int64
+    dp = np.zeros((knapsack_capacity + 1, volume_capacity + 1), dtype=dtype)
+    for n in range(total_items):
+        weight, volume, value = items[n].weight, items[n].volume, items[n].value
+        if weight > knapsack_capacity or volume > volume_capacity:
+            continue
+        # The candidate slice is a fresh array, so the in-place max still reads the previous item's row
+        candidate = dp[:knapsack_capacity + 1 - weight, :volume_capacity + 1 - volume] + value
+        np.maximum(dp[weight:, volume:], candidate, out=dp[weight:, volume:])
+    return int(dp[knapsack_capacity, volume_capacity])
+
+# Function to drop states (weight, volume, value) that another state beats on all three
+def prune_dominated(weights, volumes, values):
+    # Sort by weight, then volume, then best value first
+    order = np.lexsort((-values, volumes, weights))
+    weights, volumes, values = weights[order], volumes[order], values[order]
+    # Fenwick tree of prefix maxima over volume ranks
+    ranks = np.searchsorted(np.unique(volumes), volumes) + 1
+    tree = [NEG_INF] * (int(ranks.max()) + 1 if len(ranks) else 1)
+    keep = np.zeros(len(weights), dtype=bool)
+    for i in range(len(weights)):
+        best = NEG_INF
+        r = int(ranks[i])
+        while r > 0:
+            best = max(best, tree[r])
+            r -= r & -r
+        if best >= values[i]:
+            continue  # A lighter state with no more volume is already at least as good
+        keep[i] = True
+        r = int(ranks[i])
+        while r < len(tree):
+            tree[r] = max(tree[r], int(values[i]))
+            r += r & -r
+    return weights[keep], volumes[keep], values[keep]
+
+# Two-constraint knapsack over sparse non-dominated states, for tables too big to allocate
+def knapsack_2d_sparse(items, total_items, knapsack_capacity, volume_capacity):
+    weights = np.zeros(1, dtype=np.int64)
+    volumes = np.zeros(1, dtype=np.int64)
+    values = np.zeros(1, dtype=np.int64)
+    for n in range(total_items):
+        new_weights = weights + items[n].weight
+        new_volumes = volumes + items[n].volume
+        fits = (new_weights <= knapsack_capacity) & (new_volumes <= volume_capacity)
+        if not fits.any():
+            continue
+        weights, volumes, values = prune_dominated(
+            np.concatenate((weights, new_weights[fits])),
+            np.concatenate((volumes, new_volumes[fits])),
+            np.concatenate((values, values[fits] + items[n].value)))
+    return int(values.max())
+
+# Two-constraint knapsack, dense table when it fits in max_cells, sparse states otherwise
+def knapsack_2d(items, total_items, knapsack_capacity, volume_capacity, max_cells=50_000_000):
+    # Items with a count are expanded first so both engines only see 0/1 items
+    pieces = binary_split(items, total_items)
+    if (knapsack_capacity + 1) * (volume_capacity + 1) <= max_cells:
+        return knapsack_2d_dense(pieces, len(pieces), knapsack_capacity, volume_capacity)
+    return knapsack_2d_sparse(pieces, len(pieces), knapsack_capacity, volume_capacity)
+
+# Main program
+if __name__ == "__main__":
+    filename = input("Enter filename: ")
+    start_time = time.time()
+
+    knapsack_capacity, volume_capacity, total_items, items = read_input(filename, with_volume_capacity=True)
+    print("Knapsack capacity:", knapsack_capacity)
+    print("Volume capacity:", volume_capacity)
+    print("Total number of items:", total_items)
+
+    if volume_capacity > 0:
+        max_value = knapsack_2d(items, total_items, knapsack_capacity, volume_capacity)
+    else:
+        max_value = bounded_knapsack_queue(items, total_items, knapsack_capacity)
+    print("Maximum value:", max_value)
+
+    elapsed_time_seconds = time.time() - start_time
+    print("The program's elapsed time was %.2f seconds (%.2f milliseconds)." % (elapsed_time_seconds, elapsed_time_seconds * 1000))
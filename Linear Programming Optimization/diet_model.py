@@ -0,0 +1,122 @@
+import os
+import csv
+import time
+import numpy as np
+import scipy.sparse as sp
+import pulp
+from lp_solvers import solve_lp
+
+DATASET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dataset")
+
+# Diet model stored as arrays: one cost per food and a sparse (nutrients x foods) coefficient matrix
+class DietModel:
+    def __init__(self, foods, costs, nutrients, matrix, min_amounts, max_amounts=None):
+        self.foods = list(foods)
+        self.costs = np.asarray(costs, dtype=float)
+        self.nutrients = list(nutrients)
+        self.matrix = sp.csr_matrix(matrix, dtype=float)
+        self.min_amounts = np.asarray(min_amounts, dtype=float)
+        # No upper limit unless given (inf means unbounded)
+        self.max_amounts = np.full(len(self.nutrients), np.inf) if max_amounts is None else np.asarray(max_amounts, dtype=float)
+
+    # Load the food table (food,cost,<nutrient>...) and the requirements table (nutrient,min[,max])
+    @classmethod
+    def from_csv(cls, foods_file, nutrients_file):
+        min_amounts, max_amounts, nutrients = [], [], []
+        with open(nutrients_file, 'r', newline='') as file:
+            for row in csv.DictReader(file):
+                nutrients.append(row["nutrient"].strip())
+                min_amounts.append(float(row["min"]) if row.get("min") else 0.0)
+                max_amounts.append(float(row["max"]) if row.get("max") else np.inf)
+
+        foods, costs, rows, cols, data = [], [], [], [], []
+        with open(foods_file, 'r', newline='') as file:
+            reader = csv.reader(file)
+            header = [h.strip() for h in next(reader)]
+            # Only the columns that have a requirement end up in the model
+            column_of = {name: i for i, name in enumerate(header)}
+            missing = [n for n in nutrients if n not in column_of]
+            if missing:
+                raise ValueError(f"Nutrients {missing} have requirements but no column in {foods_file}")
+            nutrient_columns = [(r, column_of[n]) for r, n in enumerate(nutrients)]
+            cost_column = column_of["cost"]
+            for j, row in enumerate(reader):
+                foods.append(row[0].strip())
+                costs.append(float(row[cost_column]))
+                # Keep the non-zero amounts only, most foods lack most nutrients
+                for r, c in nutrient_columns:
+                    if row[c] and float(row[c]) != 0.0:
+                        rows.append(r)
+                        cols.append(j)
+                        data.append(float(row[c]))
+
+        matrix = sp.csr_matrix((data, (rows, cols)), shape=(len(nutrients), len(foods)))
+        return cls(foods, costs, nutrients, matrix, min_amounts, max_amounts)
+
+    # Same foods and requirements as Diet LO.py
+    @classmethod
+    def default(cls):
+        return cls.from_csv(os.path.join(DATASET_DIR, "foods.csv"), os.path.join(DATASET_DIR, "nutrients.csv"))
+
+    # Function to build the PuLP problem, one affine expression per matrix row instead of lpSum over dicts
+    def build_lp(self, name="Diet_Optimization"):
+        lp_problem = pulp.LpProblem(name, pulp.LpMinimize)
+        food_vars = [pulp.LpVariable(f"Food_{j}", lowBound=0, cat='Continuous') for j in range(len(self.foods))]
+
+        # Objective function: Minimize the total cost
+        lp_problem += pulp.LpAffineExpression(zip(food_vars, self.costs.tolist())), "Total Cost"
+
+        # Constraints straight from the CSR row slices
+        indptr, indices, data = self.matrix.indptr, self.matrix.indices.tolist(), self.matrix.data.tolist()
+        for r, nutrient in enumerate(self.nutrients):
+            start, stop = indptr[r], indptr[r + 1]
+            expression = pulp.LpAffineExpression(zip([food_vars[j] for j in indices[start:stop]], data[start:stop]))
+            if self.min_amounts[r] > 0:  # A zero minimum is implied by the non-negative servings
+                lp_problem.addConstraint(pulp.LpConstraint(expression, pulp.LpConstraintGE, nutrient, self.min_amounts[r]))
+            if np.isfinite(self.max_amounts[r]):
+                lp_problem.addConstraint(pulp.LpConstraint(expression.copy(), pulp.LpConstraintLE, f"{nutrient}_max", self.max_amounts[r]))
+        return lp_problem, food_vars
+
+    # Function to write the model as min c x, A_ub x <= b_ub, x >= 0 (minimums become negated rows)
+    def inequality_form(self):
+        has_min = self.min_amounts > 0
+        has_max = np.isfinite(self.max_amounts)
+        A_ub = sp.vstack([-self.matrix[has_min], self.matrix[has_max]], format='csr')
+        b_ub = np.concatenate([-self.min_amounts[has_min], self.max_amounts[has_max]])
+        return self.costs, A_ub, b_ub
+
+    # Solve the model, returns status, servings per food and total cost
+    # "cbc" goes through PuLP (MPS file + subprocess), "simplex" / "highs" / "auto" solve in process
+    def solve(self, method="cbc"):
+        if method != "cbc":
+            status, servings, total_cost = solve_lp(*self.inequality_form(), method=method)
+            if servings is None:
+                servings = np.zeros(len(self.foods))
+            return status, servings, total_cost
+        lp_problem, food_vars = self.build_lp()
+        lp_problem.solve(pulp.PULP_CBC_CMD(msg=False))
+        servings = np.array([v.varValue or 0.0 for v in food_vars])
+        return pulp.LpStatus[lp_problem.status], servings, pulp.value(lp_problem.objective)
+
+# Main program
+if __name__ == "__main__":
+    foods_file = input("Enter foods CSV (leave empty for the default data): ").strip()
+    if foods_file:
+        model = DietModel.from_csv(foods_file, input("Enter nutrients CSV: ").strip())
+    else:
+        model = DietModel.default()
+
+    method = input("Enter solver (cbc / simplex / highs / auto, default cbc): ").strip() or "cbc"
+
+    start_time = time.time()
+    status, servings, total_cost = model.solve(method)
+
+    # Print the results
+    print(f"Status: {status}")
+    print("Optimal food servings per day:")
+    for food, amount in zip(model.foods, servings):
+        if len(model.foods) <= 50 or amount > 0:
+            print(f"{food}: {amount:.2f} servings")
+    if total_cost is not None:
+        print(f"Total cost: ${total_cost:.2f}")
+    print("Build and solve took %.2f seconds." % (time.time() - start_time))
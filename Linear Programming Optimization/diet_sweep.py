@@ -0,0 +1,132 @@
+import os
+import csv
+import time
+import numpy as np
+import scipy.sparse as sp
+from concurrent.futures import ProcessPoolExecutor
+from diet_model import DietModel
+from lp_solvers import OPTIMAL, solve_simplex_basis, solve_lp
+
+# Function to read a scenario table, columns are min_<nutrient>, max_<nutrient> and cost_<food> (case-insensitive)
+# Empty or missing cells keep the model's own value. Returns (mins, maxs, costs) with one row per scenario.
+def read_scenarios(filename, model):
+    nutrient_index = {n.lower(): i for i, n in enumerate(model.nutrients)}
+    food_index = {f.lower(): j for j, f in enumerate(model.foods)}
+    mins, maxs, costs = [], [], []
+    with open(filename, 'r', newline='') as file:
+        reader = csv.DictReader(file)
+        columns = []
+        for column in reader.fieldnames:
+            kind, _, name = column.strip().lower().partition("_")
+            if kind in ("min", "max") and name in nutrient_index:
+                columns.append((column, kind, nutrient_index[name]))
+            elif kind == "cost" and name in food_index:
+                columns.append((column, kind, food_index[name]))
+            else:
+                raise ValueError(f"Unknown scenario column {column!r}")
+        for row in reader:
+            values = {"min": model.min_amounts.copy(), "max": model.max_amounts.copy(), "cost": model.costs.copy()}
+            for column, kind, index in columns:
+                if row[column].strip():
+                    values[kind][index] = float(row[column])
+            mins.append(values["min"])
+            maxs.append(values["max"])
+            costs.append(values["cost"])
+    shape = (len(mins), len(model.nutrients))
+    return np.array(mins).reshape(shape), np.array(maxs).reshape(shape), np.array(costs).reshape(len(costs), len(model.foods))
+
+# Function to solve a run of scenarios in order, each one warm-started from the last optimal basis with the same rows
+# The rows are all minimums, then the maximums the scenario sets (inf means no row), so scenarios
+# with the same set of maximums share one constraint matrix and one basis
+def _solve_chunk(matrix, mins, maxs, costs, method):
+    statuses, totals = [], np.full(len(mins), np.nan)
+    servings = np.zeros((len(mins), matrix.shape[1]))
+    dense = matrix.toarray() if method == "simplex" else None
+    systems = {}
+    for i in range(len(mins)):
+        max_rows = np.isfinite(maxs[i])
+        key = max_rows.tobytes()
+        if key not in systems:
+            if method == "simplex":
+                systems[key] = [np.vstack([-dense, dense[max_rows]]), None]
+            else:
+                systems[key] = [sp.vstack([-matrix, matrix[max_rows]], format='csr'), None]
+        A_ub, basis = systems[key]
+        b_ub = np.concatenate([-mins[i], maxs[i][max_rows]])
+        if method == "simplex":
+            status, x, total, new_basis = solve_simplex_basis(costs[i], A_ub, b_ub, basis)
+            if new_basis is not None:
+                systems[key][1] = new_basis
+        else:
+            # HiGHS through linprog can't take a starting basis, those solves are cold
+            status, x, total = solve_lp(costs[i], A_ub, b_ub, method=method)
+        statuses.append(status)
+        if status == OPTIMAL:
+            totals[i] = total
+            servings[i] = x
+    return statuses, totals, servings
+
+# Solve every scenario across a process pool, returns columnar results (one array per column)
+def scenario_sweep(model, mins, maxs, costs, workers=None, method="auto", chunk_size=None):
+    total = len(mins)
+    if method == "auto":
+        method = "simplex" if len(model.nutrients) * len(model.foods) <= 5000 else "highs"
+
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        # Long contiguous chunks make the most of warm starts, a few per worker keeps the pool busy
+        chunk_size = max(1, -(-total // (workers * 4)))
+    chunks = [(start, min(total, start + chunk_size)) for start in range(0, total, chunk_size)]
+
+    statuses = np.empty(total, dtype=object)
+    totals = np.full(total, np.nan)
+    servings = np.zeros((total, len(model.foods)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [(start, stop, pool.submit(_solve_chunk, model.matrix, mins[start:stop], maxs[start:stop], costs[start:stop], method))
+                   for start, stop in chunks]
+        for start, stop, future in futures:
+            statuses[start:stop], totals[start:stop], servings[start:stop] = future.result()
+
+    # The inputs go out with the results so every row can be traced back to its scenario
+    results = {"status": statuses.astype(str), "total_cost": totals}
+    for r, nutrient in enumerate(model.nutrients):
+        results[f"min_{nutrient}"] = mins[:, r]
+    for r, nutrient in enumerate(model.nutrients):
+        results[f"max_{nutrient}"] = maxs[:, r]
+    for j, food in enumerate(model.foods):
+        results[f"cost_{food}"] = costs[:, j]
+    for j, food in enumerate(model.foods):
+        results[f"servings_{food}"] = servings[:, j]
+    return results
+
+# Function to write columnar results, .npz keeps one array per column, anything else becomes a CSV
+def write_results(results, filename):
+    if filename.endswith(".npz"):
+        np.savez(filename, **results)
+        return
+    columns = list(results)
+    with open(filename, 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(columns)
+        writer.writerows(zip(*(results[c].tolist() for c in columns)))
+
+# Main program
+if __name__ == "__main__":
+    foods_file = input("Enter foods CSV (leave empty for the default data): ").strip()
+    if foods_file:
+        model = DietModel.from_csv(foods_file, input("Enter nutrients CSV: ").strip())
+    else:
+        model = DietModel.default()
+    scenarios_file = input("Enter scenarios CSV: ").strip()
+    workers = int(input("Enter number of workers (default all cores): ") or 0) or None
+    output_file = input("Enter output file (.npz or .csv): ").strip()
+
+    start_time = time.time()
+    mins, maxs, costs = read_scenarios(scenarios_file, model)
+    results = scenario_sweep(model, mins, maxs, costs, workers)
+    write_results(results, output_file)
+
+    elapsed_time = time.time() - start_time
+    optimal = int((results["status"] == OPTIMAL).sum())
+    print(f"Solved {len(mins)} scenarios ({optimal} optimal) in {elapsed_time:.2f} seconds.")
+    print(f"Results written to {output_file}")
@@ -0,0 +1,166 @@
+import numpy as np
+import scipy.sparse as sp
+
+try:
+    from scipy.optimize import linprog
+except ImportError:  # Fall back to the NumPy simplex only
+    linprog = None
+
+# Status strings, same as pulp.LpStatus so the output matches Diet LO.py
+OPTIMAL, INFEASIBLE, UNBOUNDED, NOT_SOLVED = "Optimal", "Infeasible", "Unbounded", "Not Solved"
+
+# Function to run the revised simplex on min c x, A x = b, x >= 0 from a feasible starting basis
+# Returns the status, the final basis and the number of iterations
+def _simplex_phase(c, A, b, basis, max_iterations, tol):
+    m, n = A.shape
+    for iteration in range(max_iterations):
+        B_inv = np.linalg.inv(A[:, basis])
+        x_B = B_inv @ b
+        y = c[basis] @ B_inv  # Simplex multipliers
+        reduced = c - y @ A
+        reduced[basis] = 0.0
+        candidates = np.flatnonzero(reduced < -tol)
+        if len(candidates) == 0:
+            return OPTIMAL, basis, iteration
+        # Dantzig's rule, Bland's rule (smallest index) once steps stop making progress
+        entering = int(candidates[0]) if iteration > 50 * (m + n) else int(candidates[np.argmin(reduced[candidates])])
+        direction = B_inv @ A[:, entering]
+        positive = direction > tol
+        if not positive.any():
+            return UNBOUNDED, basis, iteration
+        ratios = np.full(m, np.inf)
+        ratios[positive] = x_B[positive] / direction[positive]
+        leaving = int(np.argmin(ratios))
+        basis = basis.copy()
+        basis[leaving] = entering
+    return NOT_SOLVED, basis, max_iterations
+
+# Function to run the dual simplex on min c x, A x = b, x >= 0 from a dual feasible basis
+# That's what an old optimal basis is after only b changed, so it's the warm start for new requirements
+def _dual_simplex_phase(c, A, b, basis, max_iterations, tol):
+    m, n = A.shape
+    for iteration in range(max_iterations):
+        B_inv = np.linalg.inv(A[:, basis])
+        x_B = B_inv @ b
+        leaving = int(np.argmin(x_B))
+        if x_B[leaving] >= -tol:
+            return OPTIMAL, basis, iteration
+        row = B_inv[leaving] @ A
+        row[basis] = 0.0
+        candidates = np.flatnonzero(row < -tol)
+        if len(candidates) == 0:
+            return INFEASIBLE, basis, iteration
+        reduced = c - (c[basis] @ B_inv) @ A
+        entering = int(candidates[np.argmin(reduced[candidates] / -row[candidates])])
+        basis = basis.copy()
+        basis[leaving] = entering
+    return NOT_SOLVED, basis, max_iterations
+
+# Function to pick up from a previous optimal basis, returns None when it can't be used
+def _warm_start(c, A, b, basis, max_iterations, tol):
+    if basis is None or len(basis) != A.shape[0]:
+        return None
+    try:
+        B_inv = np.linalg.inv(A[:, basis])
+    except np.linalg.LinAlgError:
+        return None
+    if (B_inv @ b).min() >= -tol:
+        # Still primal feasible (only costs changed), straight to phase II
+        return _simplex_phase(c, A, b, basis, max_iterations, tol)
+    reduced = c - (c[basis] @ B_inv) @ A
+    if reduced.min() >= -tol:
+        # Still dual feasible (only requirements changed), dual simplex
+        return _dual_simplex_phase(c, A, b, basis, max_iterations, tol)
+    return None
+
+# Dense two-phase revised simplex for min c x, A x = b, x >= 0
+# Small problems only (B is inverted each iteration), but there's no process or file overhead at all.
+# Returns status, x, objective and the optimal basis, which can be passed back in as a warm start.
+def revised_simplex_basis(c, A, b, basis=None, max_iterations=10000, tol=1e-9):
+    c = np.asarray(c, dtype=float)
+    A = np.array(A, dtype=float)
+    b = np.array(b, dtype=float)
+    m, n = A.shape
+
+    warm = _warm_start(c, A, b, None if basis is None else np.asarray(basis), max_iterations, tol)
+    if warm is not None:
+        status, basis, _ = warm
+        if status != OPTIMAL:
+            return status, None, None, None
+    else:
+        # Make the right-hand side non-negative so the artificial basis is feasible
+        negative = b < 0
+        A[negative] *= -1
+        b[negative] *= -1
+
+        # Phase I: minimise the sum of artificial variables
+        A_phase1 = np.hstack([A, np.eye(m)])
+        c_phase1 = np.concatenate([np.zeros(n), np.ones(m)])
+        basis = np.arange(n, n + m)
+        status, basis, iterations = _simplex_phase(c_phase1, A_phase1, b, basis, max_iterations, tol)
+        if status != OPTIMAL:
+            return status, None, None, None
+        x_B = np.linalg.solve(A_phase1[:, basis], b)
+        if x_B[basis >= n].sum() > tol * max(1.0, np.abs(b).max()):
+            return INFEASIBLE, None, None, None
+
+        # Pivot artificials that are still basic (at zero) out, rows where that's impossible are redundant
+        keep_rows = np.ones(m, dtype=bool)
+        for r in np.flatnonzero(basis >= n):
+            B_inv_row = np.linalg.inv(A_phase1[:, basis])[r]
+            row = B_inv_row @ A
+            row[basis[basis < n]] = 0.0
+            columns = np.flatnonzero(np.abs(row) > tol)
+            if len(columns):
+                basis[r] = columns[0]
+            else:
+                keep_rows[r] = False
+        A, b, basis = A[keep_rows], b[keep_rows], basis[keep_rows]
+
+        # Phase II: the real objective from the feasible basis
+        status, basis, _ = _simplex_phase(c, A, b, basis, max_iterations - iterations, tol)
+        if status != OPTIMAL:
+            return status, None, None, None
+    x = np.zeros(n)
+    x[basis] = np.linalg.solve(A[:, basis], b)
+    x[np.abs(x) < tol] = 0.0
+    # If redundant rows were dropped the basis doesn't fit the full problem, so it's not handed back
+    return OPTIMAL, x, float(c @ x), basis if len(basis) == m else None
+
+# Same as revised_simplex_basis without the basis
+def revised_simplex(c, A, b, max_iterations=10000, tol=1e-9):
+    return revised_simplex_basis(c, A, b, None, max_iterations, tol)[:3]
+
+# Function to solve min c x, A_ub x <= b_ub, x >= 0 with the dense simplex (adds the slack columns)
+# Also returns the optimal basis, pass it back as basis to warm start a similar problem
+def solve_simplex_basis(c, A_ub, b_ub, basis=None):
+    A_ub = A_ub.toarray() if sp.issparse(A_ub) else np.asarray(A_ub, dtype=float)
+    m, n = A_ub.shape
+    status, x, objective, basis = revised_simplex_basis(np.concatenate([c, np.zeros(m)]), np.hstack([A_ub, np.eye(m)]), b_ub, basis)
+    return status, (x[:n] if x is not None else None), objective, basis
+
+def solve_simplex(c, A_ub, b_ub):
+    return solve_simplex_basis(c, A_ub, b_ub)[:3]
+
+# HiGHS status codes from scipy's linprog
+_HIGHS_STATUS = {0: OPTIMAL, 1: NOT_SOLVED, 2: INFEASIBLE, 3: UNBOUNDED, 4: NOT_SOLVED}
+
+# Function to solve min c x, A_ub x <= b_ub, x >= 0 with SciPy's HiGHS (in process, takes sparse input)
+def solve_highs(c, A_ub, b_ub):
+    if linprog is None:
+        raise ImportError("scipy.optimize is needed for the HiGHS solver")
+    result = linprog(c, A_ub=A_ub, b_ub=b_ub, bounds=(0, None), method="highs")
+    status = _HIGHS_STATUS.get(result.status, NOT_SOLVED)
+    if status != OPTIMAL:
+        return status, None, None
+    return status, result.x, float(result.fun)
+
+# Dense simplex for small problems, HiGHS for the rest (or whenever asked for)
+def solve_lp(c, A_ub, b_ub, method="auto", dense_limit=5000):
+    if method == "auto":
+        method = "simplex" if (A_ub.shape[0] * A_ub.shape[1] <= dense_limit or linprog is None) else "highs"
+    if method == "simplex":
+        return solve_simplex(c, A_ub, b_ub)
+    if method == "highs":
+        return solve_highs(c, A_ub, b_ub)
+    raise ValueError(f"Unknown LP method {method!r}, expected 'auto', 'simplex' or 'highs'")
@@ -1,105 +1,37 @@
 import random
-import math
-import matplotlib.pyplot as plt
-
-# Class to store the coordinates of a point
-class Coordinate:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-
-# Function to read a TSP file and extract the coordinates
-def read_tsp_file(filename):
-    coords = []
-    dimension_value = 0
-    name = ""
-
-    try:
-        with open(filename, 'r') as file:
-            in_node_section = False
-            for line in file:
-                line = line.strip()
-                if line.startswith("NAME"):
-                    # Extract the name of the problem
-                    name = line.split(":")[1].strip()
-                elif line.startswith("DIMENSION"):
-                    # Extract the number of nodes
-                    dimension_value = int(line.split(":")[1].strip())
-                elif line.startswith("NODE_COORD_SECTION"):
-                    # Start reading the coordinates
-                    in_node_section = True
-                elif in_node_section:
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        # Extract and store the coordinates
-                        x, y = map(float, parts[1:])
-                        coords.append(Coordinate(x, y))
-                    # Stop reading if we have reached the specified number of nodes
-                    if len(coords) == dimension_value:
-                        break
-        return name, dimension_value, coords
-    except FileNotFoundError:
-        print(f"Error: File {filename} not found.")
-        return None, None, []
-    except Exception as e:
-        print(f"Error reading file: {e}")
-        return None, None, []
-
-# Function to calculate the Euclidean distance between two points
-def calculate_distance(coord1, coord2):
-    return math.sqrt((coord1.x - coord2.x) ** 2 + (coord1.y - coord2.y) ** 2)
+from tsplib import read_tsp_instance
+from render import render_comparison
+from tour_store import TourStore, warm_start
+from lower_bound import tour_gap
 
 # Function to generate a random path and calculate its total distance
-def generate_random_path(coords, seed=None):
+def generate_random_path(instance, seed=None):
+    dist = instance.distance_function()
     if seed is not None:
         random.seed(seed)
 
-    dimension_value = len(coords)
+    dimension_value = len(instance)
     path = list(range(dimension_value))
     random.shuffle(path)
     path.append(path[0])  # Return to the starting point to complete the loop
 
     total_distance = 0
     for i in range(1, len(path)):
-        total_distance += calculate_distance(coords[path[i - 1]], coords[path[i]])
+        total_distance += dist(path[i - 1], path[i])
     
     return total_distance, path
 
-# Function to plot the path on a graph
-def plot_paths(coords, initial_path, optimized_path, initial_title, optimized_title):
-    x_initial = [coords[i].x for i in initial_path]
-    y_initial = [coords[i].y for i in initial_path]
-    x_optimized = [coords[i].x for i in optimized_path]
-    y_optimized = [coords[i].y for i in optimized_path]
-
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(20, 8))
-
-    ax1.plot(x_initial, y_initial, marker='o', linestyle='-', linewidth=1, markersize=4, color='b')
-    ax1.set_title(initial_title)
-    ax1.set_xlabel('X Coordinate')
-    ax1.set_ylabel('Y Coordinate')
-    ax1.legend(['Path'], loc='best')
-    ax1.grid(True)
-
-    ax2.plot(x_optimized, y_optimized, marker='o', linestyle='-', linewidth=1, markersize=4, color='b')
-    ax2.set_title(optimized_title)
-    ax2.set_xlabel('X Coordinate')
-    ax2.set_ylabel('Y Coordinate')
-    ax2.legend(['Path'], loc='best')
-    ax2.grid(True)
-
-    plt.show()
-
 # Function to perform 2-opt optimization
-def two_opt(coords, path):
+def two_opt(instance, path):
+    dist = instance.distance_function()
     def reverse_segment_if_better(path, i, k):
         new_path = path[:i] + path[i:k + 1][::-1] + path[k + 1:] 
-        if calculate_total_distance(coords, new_path) < calculate_total_distance(coords, path):
+        if calculate_total_distance(instance, new_path) < calculate_total_distance(instance, path):
             return new_path
         return path
 
-    def calculate_total_distance(coords, path): #Calculate the total distance of the given path.
-        return sum(calculate_distance(coords[path[i - 1]], coords[path[i]]) for i in range(len(path))) #Return the float
+    def calculate_total_distance(instance, path): #Calculate the total distance of the given path.
+        return sum(dist(path[i - 1], path[i]) for i in range(len(path))) #Return the float
 
     improved = True
     while improved:
@@ -114,14 +46,21 @@ def two_opt(coords, path):
 
 # Main program
 filename = input("Enter the filename: ").strip()
+use_store = input("Warm start from the best-known tour store? (y/n): ").strip().lower() == "y"
+report_gap = input("Report the certified gap to the Held-Karp lower bound? (y/n): ").strip().lower() == "y"
 
 print(f"Attempting to read file: {filename}")
 
-name, dimension_value, coords = read_tsp_file(filename)
+instance = read_tsp_instance(filename)
 
-if coords:
+if instance is not None and len(instance):
+    name, dimension_value = instance.name, len(instance)
     # Generate a random path
-    total_distance, random_path = generate_random_path(coords, seed=42)
+    total_distance, random_path = generate_random_path(instance, seed=42)
+    if use_store:
+        # Start from the stored tour instead if it's better than the random one
+        store = TourStore()
+        total_distance, random_path = warm_start(store, instance, total_distance, random_path)
 
     print("Random Path:", random_path)
     print("Name:", name)
@@ -129,13 +68,24 @@ if coords:
     print("Total Distance (Random Path):", total_distance)
     
     # Perform 2-opt optimization
-    optimized_path = two_opt(coords, random_path)
-    optimized_distance = sum(calculate_distance(coords[optimized_path[i - 1]], coords[optimized_path[i]]) for i in range(len(optimized_path)))
+    optimized_path = two_opt(instance, random_path)
+    optimized_distance = instance.path_length(optimized_path)
 
     print("Optimized Path:", optimized_path)
     print("Total Distance (Optimized Path):", optimized_distance)
+    if report_gap:
+        lower_bound, gap = tour_gap(instance, optimized_distance)
+        if lower_bound is None:
+            print("No certified lower bound for this instance.")
+        else:
+            print("Held-Karp Lower Bound:", lower_bound)
+            print(f"Certified Gap: {gap:.3f}%")
+    if use_store and store.save_if_better(instance, optimized_path, name, "2optRandom"):
+        print("Saved as the new best-known tour.")
     
     # Plot both paths side by side
-    plot_paths(coords, random_path, optimized_path, 'Randomly Generated Salesman Path', '2-opt Optimized Salesman Path')
+    if instance.points is not None:
+        output_file = render_comparison(instance.points, random_path, optimized_path, f"{name}_2optRandom.png", 'Randomly Generated Salesman Path', '2-opt Optimized Salesman Path')
+        print("Saved plot to", output_file)
 else:
-    print("Failed to read coordinates from the file.")
+    print("Failed to read the instance from the file.")
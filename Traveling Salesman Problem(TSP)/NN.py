@@ -1,57 +1,11 @@
 import random
-import math
-import matplotlib.pyplot as plt
-
-# Class to store the coordinates of a point
-class Coordinate:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-
-# Function to read a TSP file and extract the coordinates
-def read_tsp_file(filename):
-    coords = []
-    dimension_value = 0
-    name = ""
-
-    try:
-        with open(filename, 'r') as file:
-            in_node_section = False
-            for line in file:
-                line = line.strip()
-                if line.startswith("NAME"):
-                    # Extract the name of the problem
-                    name = line.split(":")[1].strip()
-                elif line.startswith("DIMENSION"):
-                    # Extract the number of nodes
-                    dimension_value = int(line.split(":")[1].strip())
-                elif line.startswith("NODE_COORD_SECTION"):
-                    # Start reading the coordinates
-                    in_node_section = True
-                elif in_node_section:
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        # Extract and store the coordinates
-                        x, y = map(float, parts[1:])
-                        coords.append(Coordinate(x, y))
-                    # Stop reading if we have reached the specified number of nodes
-                    if len(coords) == dimension_value:
-                        break
-        return name, dimension_value, coords
-    except FileNotFoundError:
-        print(f"Error: File {filename} not found.")
-        return None, None, []
-    except Exception as e:
-        print(f"Error reading file: {e}")
-        return None, None, []
-
-# Function to calculate the Euclidean distance between two points
-def calculate_distance(coord1, coord2):
-    return math.sqrt((coord1.x - coord2.x) ** 2 + (coord1.y - coord2.y) ** 2)
+from tsplib import read_tsp_instance
+from render import render_tour
 
 # Nearest Neighbor algorithm implementation
-def nearest_neighbor(coords):
-    n = len(coords)
+def nearest_neighbor(instance):
+    dist = instance.distance_function()
+    n = len(instance)
     if n == 0:
         return 0, []
 
@@ -67,7 +21,7 @@ def nearest_neighbor(coords):
         nearest_index = None
 
         for next_index in unvisited:
-            distance = calculate_distance(coords[current_index], coords[next_index])
+            distance = dist(current_index, next_index)
             if distance < nearest_distance:
                 nearest_distance = distance
                 nearest_index = next_index
@@ -78,43 +32,29 @@ def nearest_neighbor(coords):
         current_index = nearest_index
 
     # Complete the tour by returning to the starting city
-    total_distance += calculate_distance(coords[path[-1]], coords[path[0]])
+    total_distance += dist(path[-1], path[0])
     path.append(path[0])
 
     return total_distance, path
 
-# Function to plot the path on a graph
-def plot_path(coords, path):
-    x = [coords[i].x for i in path]
-    y = [coords[i].y for i in path]
-
-    plt.figure(figsize=(10, 8))
-    plt.plot(x, y, marker='o', linestyle='-', linewidth=1, markersize=4, color='b')
-    plt.title('Nearest Neighbor Salesman Path')
-    plt.xlabel('X Coordinate')
-    plt.ylabel('Y Coordinate')
-    plt.legend(['Path'], loc='best')
-    plt.grid(True)
-    # Annotate each point with its index (Red name for nodes, commented out to be more visual appealing.)
-    # for i, txt in enumerate(path):
-    #     plt.annotate(txt, (x[i], y[i]), textcoords="offset points", xytext=(0,10), ha='center', fontsize=8, color='red')
-    plt.show()
-
 # Main program
 filename = input("Enter the filename: ").strip()
 
 print(f"Attempting to read file: {filename}")
 
-name, dimension_value, coords = read_tsp_file(filename)
+instance = read_tsp_instance(filename)
 
-if coords:
-    total_distance, nearest_neighbor_path = nearest_neighbor(coords)
+if instance is not None and len(instance):
+    name, dimension_value = instance.name, len(instance)
+    total_distance, nearest_neighbor_path = nearest_neighbor(instance)
 
     print("Nearest Neighbor Path:", nearest_neighbor_path)
     print("Name:", name)
     print("Dimension:", dimension_value)
     print("Total Distance:", total_distance)
     
-    plot_path(coords, nearest_neighbor_path)
+    if instance.points is not None:
+        output_file = render_tour(instance.points, nearest_neighbor_path, f"{name}_nn.png", 'Nearest Neighbor Salesman Path')
+        print("Saved plot to", output_file)
 else:
-    print("Failed to read coordinates from the file.")
+    print("Failed to read the instance from the file.")
@@ -1,57 +1,14 @@
 import random
 import math
-import matplotlib.pyplot as plt
-
-# Class to store the coordinates of a point
-class Coordinate:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-
-# Function to read a TSP file and extract the coordinates
-def read_tsp_file(filename):
-    coords = []
-    dimension_value = 0
-    name = ""
-
-    try:
-        with open(filename, 'r') as file:
-            in_node_section = False
-            for line in file:
-                line = line.strip()
-                if line.startswith("NAME"):
-                    # Extract the name of the problem
-                    name = line.split(":")[1].strip()
-                elif line.startswith("DIMENSION"):
-                    # Extract the number of nodes
-                    dimension_value = int(line.split(":")[1].strip())
-                elif line.startswith("NODE_COORD_SECTION"):
-                    # Start reading the coordinates
-                    in_node_section = True
-                elif in_node_section:
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        # Extract and store the coordinates
-                        x, y = map(float, parts[1:])
-                        coords.append(Coordinate(x, y))
-                    # Stop reading if we have reached the specified number of nodes
-                    if len(coords) == dimension_value:
-                        break
-        return name, dimension_value, coords
-    except FileNotFoundError:
-        print(f"Error: File {filename} not found.")
-        return None, None, []
-    except Exception as e:
-        print(f"Error reading file: {e}")
-        return None, None, []
-
-# Function to calculate the Euclidean distance between two points
-def calculate_distance(coord1, coord2):
-    return math.sqrt((coord1.x - coord2.x) ** 2 + (coord1.y - coord2.y) ** 2)
+from tsplib import read_tsp_instance
+from render import render_comparison
+from tour_store import TourStore, warm_start
+from lower_bound import tour_gap
 
 # Nearest Neighbor algorithm implementation starting at the given node
-def nearest_neighbor(coords, start_node):
-    n = len(coords)
+def nearest_neighbor(instance, start_node):
+    dist = instance.distance_function()
+    n = len(instance)
     if n == 0:
         return 0, []
 
@@ -65,7 +22,7 @@ def nearest_neighbor(coords, start_node):
         nearest_index = None
 
         for next_index in unvisited:
-            distance = calculate_distance(coords[current_index], coords[next_index])
+            distance = dist(current_index, next_index)
             if distance < nearest_distance:
                 nearest_distance = distance
                 nearest_index = next_index
@@ -75,19 +32,19 @@ def nearest_neighbor(coords, start_node):
         total_distance += nearest_distance
         current_index = nearest_index
 
-    total_distance += calculate_distance(coords[path[-1]], coords[path[0]])
+    total_distance += dist(path[-1], path[0])
     path.append(path[0])
 
     return total_distance, path
 
 # Function to calculate the total distance of a path
-def calculate_total_distance(coords, path):
-    return sum(calculate_distance(coords[path[i - 1]], coords[path[i]]) for i in range(len(path)))
+def calculate_total_distance(instance, path):
+    return instance.path_length(path)
 
 # Function to perform simulated annealing with enhanced swapping mechanism
-def simulated_annealing(coords, initial_path, initial_temp, cooling_rate, num_iterations):
+def simulated_annealing(instance, initial_path, initial_temp, cooling_rate, num_iterations):
     current_path = initial_path[:]
-    current_distance = calculate_total_distance(coords, current_path)
+    current_distance = calculate_total_distance(instance, current_path)
     best_path = list(current_path)
     best_distance = current_distance
     temperature = initial_temp
@@ -107,7 +64,7 @@ def simulated_annealing(coords, initial_path, initial_temp, cooling_rate, num_it
             a, b = sorted(random.sample(range(1, l), 2))
             new_path[a:b+1] = new_path[a+1:b+1] + new_path[a:a+1]
 
-        new_distance = calculate_total_distance(coords, new_path)
+        new_distance = calculate_total_distance(instance, new_path)
 
         # Accept the new solution with a probability dependent on the temperature and the distance difference
         if new_distance < current_distance or random.random() < math.exp((current_distance - new_distance) / temperature):
@@ -128,65 +85,48 @@ def simulated_annealing(coords, initial_path, initial_temp, cooling_rate, num_it
 
     return best_distance, best_path
 
-# Function to plot the paths on a graph
-def plot_path(coords, path, optimized_path=None, title="Salesman Path Comparison"):
-    plt.figure(figsize=(20, 8))
-
-    if optimized_path:
-        # Plot the initial NN path
-        plt.subplot(1, 2, 1)
-        x_initial = [coords[i].x for i in path]
-        y_initial = [coords[i].y for i in path]
-        plt.plot(x_initial, y_initial, marker='o', linestyle='-', linewidth=2, markersize=4, color='k')
-        plt.title('Nearest Neighbor Salesman Path')
-        plt.xlabel('X Coordinate')
-        plt.ylabel('Y Coordinate')
-        plt.legend(['Path'], loc='best')
-        plt.grid(True)
-
-        # Plot the optimized SA path
-        plt.subplot(1, 2, 2)
-        x_optimized = [coords[i].x for i in optimized_path]
-        y_optimized = [coords[i].y for i in optimized_path]
-        plt.plot(x_optimized, y_optimized, marker='o', linestyle='-', linewidth=2, markersize=4, color='k')
-        plt.title('Simulated Annealing Optimized Salesman Path')
-        plt.xlabel('X Coordinate')
-        plt.ylabel('Y Coordinate')
-        plt.legend(['Path'], loc='best')
-        plt.grid(True)
-    else:
-        # Plot a single path
-        x = [coords[i].x for i in path]
-        y = [coords[i].y for i in path]
-        plt.plot(x, y, marker='o', linestyle='-', linewidth=1, markersize=4, color='b')
-        plt.title(title)
-        plt.xlabel('X Coordinate')
-        plt.ylabel('Y Coordinate')
-        plt.legend(['Path'], loc='best')
-        plt.grid(True)
-
-    plt.show()
-
 # Main program
 filename = input("Enter the filename: ").strip()
+use_store = input("Warm start from the best-known tour store? (y/n): ").strip().lower() == "y"
+report_gap = input("Report the certified gap to the Held-Karp lower bound? (y/n): ").strip().lower() == "y"
 
 print(f"Attempting to read file: {filename}")
 
-name, dimension_value, coords = read_tsp_file(filename)
+instance = read_tsp_instance(filename)
 
-if coords:
+if instance is not None and len(instance):
+    name, dimension_value = instance.name, len(instance)
     best_sa_distance = float('inf')
     best_sa_path = []
     best_start_node = 0
+    best_start_path = []
 
     # Threshold distance for early stopping
     threshold_distance = 500  # Example value
 
-    for start_node in range(len(coords)):
-        # Nearest Neighbor algorithm
-        nn_total_distance, nn_path = nearest_neighbor(coords, start_node)
-        print(f"Starting Node {start_node} - Nearest Neighbor Path: {nn_path}")
-        print(f"Total Distance (Nearest Neighbor): {nn_total_distance}")
+    # Every start node gets its own nearest neighbor start, unless the stored tour beats the first one:
+    # then the sweep would only run from the same stored tour again and again, so it runs once from it
+    start_nodes = range(len(instance))
+    stored_path = None
+    if use_store:
+        store = TourStore()
+        nn_total_distance, nn_path = nearest_neighbor(instance, 0)
+        stored_distance, start_path = warm_start(store, instance, nn_total_distance, nn_path)
+        if start_path is not nn_path:
+            print(f"Starting from the stored tour ({stored_distance}), skipping the start node sweep.")
+            stored_path = start_path
+            start_nodes = [0]
+
+    for start_node in start_nodes:
+        if stored_path is not None:
+            start_label = "Stored Tour"
+            nn_path = stored_path
+        else:
+            start_label = f"Starting Node {start_node}"
+            # Nearest Neighbor algorithm
+            nn_total_distance, nn_path = nearest_neighbor(instance, start_node)
+            print(f"{start_label} - Nearest Neighbor Path: {nn_path}")
+            print(f"Total Distance (Nearest Neighbor): {nn_total_distance}")
 
         # Simulated annealing parameters
         initial_temp = 100000
@@ -194,8 +134,8 @@ if coords:
         num_iterations = 200000
 
         # Perform simulated annealing starting from the nearest neighbor path
-        sa_total_distance, sa_path = simulated_annealing(coords, nn_path, initial_temp, cooling_rate, num_iterations)
-        print(f"Starting Node {start_node} - Simulated Annealing Path: {sa_path}")
+        sa_total_distance, sa_path = simulated_annealing(instance, nn_path, initial_temp, cooling_rate, num_iterations)
+        print(f"{start_label} - Simulated Annealing Path: {sa_path}")
         print(f"Total Distance (Simulated Annealing): {sa_total_distance}")
 
         # Update the best solution found so far
@@ -203,18 +143,31 @@ if coords:
             best_sa_distance = sa_total_distance
             best_sa_path = sa_path
             best_start_node = start_node
+            best_start_path = nn_path
 
         # Early stopping if the threshold is reached
         if best_sa_distance < threshold_distance:
             print(f"Threshold distance reached with start node {start_node}. Stopping early.")
             break
 
-    print(f"Best Starting Node: {best_start_node}")
+    if stored_path is None:
+        print(f"Best Starting Node: {best_start_node}")
     print("Best Simulated Annealing Path:", best_sa_path)
     print("Total Distance (Best Simulated Annealing):", best_sa_distance)
-
-    # Plot the best paths for comparison
-    nn_total_distance, nn_path = nearest_neighbor(coords, best_start_node)
-    plot_path(coords, nn_path, best_sa_path)
+    if report_gap:
+        lower_bound, gap = tour_gap(instance, best_sa_distance)
+        if lower_bound is None:
+            print("No certified lower bound for this instance.")
+        else:
+            print("Held-Karp Lower Bound:", lower_bound)
+            print(f"Certified Gap: {gap:.3f}%")
+    if use_store and store.save_if_better(instance, best_sa_path, name, "SAnn"):
+        print("Saved as the new best-known tour.")
+
+    # Plot the tour the best run started from next to its result
+    start_title = 'Stored Best-Known Salesman Path' if stored_path is not None else 'Nearest Neighbor Salesman Path'
+    if instance.points is not None:
+        output_file = render_comparison(instance.points, best_start_path, best_sa_path, f"{name}_SAnn.png", start_title, 'Simulated Annealing Optimized Salesman Path')
+        print("Saved plot to", output_file)
 else:
-    print("Failed to read coordinates from the file.")
+    print("Failed to read the instance from the file.")
@@ -1,78 +1,35 @@
 import random
 import math
-import matplotlib.pyplot as plt
-
-# Class to store the coordinates of a point
-class Coordinate:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-
-# Function to read a TSP file and extract the coordinates
-def read_tsp_file(filename):
-    coords = []
-    dimension_value = 0
-    name = ""
-
-    try:
-        with open(filename, 'r') as file:
-            in_node_section = False
-            for line in file:
-                line = line.strip()
-                if line.startswith("NAME"):
-                    # Extract the name of the problem
-                    name = line.split(":")[1].strip()
-                elif line.startswith("DIMENSION"):
-                    # Extract the number of nodes
-                    dimension_value = int(line.split(":")[1].strip())
-                elif line.startswith("NODE_COORD_SECTION"):
-                    # Start reading the coordinates
-                    in_node_section = True
-                elif in_node_section:
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        # Extract and store the coordinates
-                        x, y = map(float, parts[1:])
-                        coords.append(Coordinate(x, y))
-                    # Stop reading if we have reached the specified number of nodes
-                    if len(coords) == dimension_value:
-                        break
-        return name, dimension_value, coords
-    except FileNotFoundError:
-        print(f"Error: File {filename} not found.")
-        return None, None, []
-    except Exception as e:
-        print(f"Error reading file: {e}")
-        return None, None, []
-
-# Function to calculate the Euclidean distance between two points
-def calculate_distance(coord1, coord2):
-    return math.sqrt((coord1.x - coord2.x) ** 2 + (coord1.y - coord2.y) ** 2)
+from tsplib import read_tsp_instance
+from render import render_comparison
+from tour_store import TourStore, warm_start
+from lower_bound import tour_gap
 
 # Function to generate a random path and calculate its total distance
-def generate_random_path(coords, seed=None):
+def generate_random_path(instance, seed=None):
+    dist = instance.distance_function()
     if seed is not None:
         random.seed(seed)
 
-    dimension_value = len(coords)
+    dimension_value = len(instance)
     path = list(range(dimension_value))
     random.shuffle(path)
     path.append(path[0])  # Return to the starting point to complete the loop
 
     total_distance = 0
     for i in range(1, len(path)):
-        total_distance += calculate_distance(coords[path[i - 1]], coords[path[i]])
+        total_distance += dist(path[i - 1], path[i])
     
     return total_distance, path
 
 # Function to calculate the total distance of a path
-def calculate_total_distance(coords, path):
-    return sum(calculate_distance(coords[path[i - 1]], coords[path[i]]) for i in range(len(path)))
+def calculate_total_distance(instance, path):
+    return instance.path_length(path)
 
 # Function to perform simulated annealing
-def simulated_annealing(coords, initial_path, initial_temp, cooling_rate, num_iterations):
+def simulated_annealing(instance, initial_path, initial_temp, cooling_rate, num_iterations):
     current_path = initial_path
-    current_distance = calculate_total_distance(coords, current_path)
+    current_distance = calculate_total_distance(instance, current_path)
     best_path = list(current_path)
     best_distance = current_distance
     temperature = initial_temp
@@ -84,7 +41,7 @@ def simulated_annealing(coords, initial_path, initial_temp, cooling_rate, num_it
         a, b = random.sample(range(1, l), 2)
         new_path[a], new_path[b] = new_path[b], new_path[a]
 
-        new_distance = calculate_total_distance(coords, new_path)
+        new_distance = calculate_total_distance(instance, new_path)
 
         # Accept the new solution with a probability dependent on the temperature and the distance difference
         if new_distance < current_distance or random.random() < math.exp((current_distance - new_distance) / temperature):
@@ -101,55 +58,23 @@ def simulated_annealing(coords, initial_path, initial_temp, cooling_rate, num_it
 
     return best_distance, best_path
 
-# Function to plot the paths on a graph
-def plot_path(coords, path, optimized_path=None, title="Salesman Path Comparison"):
-    plt.figure(figsize=(20, 8))
-
-    if optimized_path:
-        # Plot the initial random path
-        plt.subplot(1, 2, 1)
-        x_random = [coords[i].x for i in path]
-        y_random = [coords[i].y for i in path]
-        plt.plot(x_random, y_random, marker='o', linestyle='-', linewidth=1, markersize=4, color='b')
-        plt.title('Randomly Generated Salesman Path')
-        plt.xlabel('X Coordinate')
-        plt.ylabel('Y Coordinate')
-        plt.legend(['Path'], loc='best')
-        plt.grid(True)
-
-        # Plot the optimized path
-        plt.subplot(1, 2, 2)
-        x_optimized = [coords[i].x for i in optimized_path]
-        y_optimized = [coords[i].y for i in optimized_path]
-        plt.plot(x_optimized, y_optimized, marker='o', linestyle='-', linewidth=1, markersize=4, color='b')
-        plt.title('Simulated Annealing Optimized Salesman Path')
-        plt.xlabel('X Coordinate')
-        plt.ylabel('Y Coordinate')
-        plt.legend(['Path'], loc='best')
-        plt.grid(True)
-    else:
-        # Plot a single path
-        x = [coords[i].x for i in path]
-        y = [coords[i].y for i in path]
-        plt.plot(x, y, marker='o', linestyle='-', linewidth=1, markersize=4, color='b')
-        plt.title(title)
-        plt.xlabel('X Coordinate')
-        plt.ylabel('Y Coordinate')
-        plt.legend(['Path'], loc='best')
-        plt.grid(True)
-
-    plt.show()
-
 # Main program
 filename = input("Enter the filename: ").strip()
+use_store = input("Warm start from the best-known tour store? (y/n): ").strip().lower() == "y"
+report_gap = input("Report the certified gap to the Held-Karp lower bound? (y/n): ").strip().lower() == "y"
 
 print(f"Attempting to read file: {filename}")
 
-name, dimension_value, coords = read_tsp_file(filename)
+instance = read_tsp_instance(filename)
 
-if coords:
+if instance is not None and len(instance):
+    name, dimension_value = instance.name, len(instance)
     # Generate a random path
-    total_distance, random_path = generate_random_path(coords, seed=42)
+    total_distance, random_path = generate_random_path(instance, seed=42)
+    if use_store:
+        # Start from the stored tour instead if it's better than the random one
+        store = TourStore()
+        total_distance, random_path = warm_start(store, instance, total_distance, random_path)
 
     print("Random Path:", random_path)
     print("Name:", name)
@@ -162,12 +87,23 @@ if coords:
     num_iterations = 100000
     
     # Perform simulated annealing
-    optimized_distance, optimized_path = simulated_annealing(coords, random_path, initial_temp, cooling_rate, num_iterations)
+    optimized_distance, optimized_path = simulated_annealing(instance, random_path, initial_temp, cooling_rate, num_iterations)
 
     print("Optimized Path:", optimized_path)
     print("Total Distance (Optimized Path):", optimized_distance)
+    if report_gap:
+        lower_bound, gap = tour_gap(instance, optimized_distance)
+        if lower_bound is None:
+            print("No certified lower bound for this instance.")
+        else:
+            print("Held-Karp Lower Bound:", lower_bound)
+            print(f"Certified Gap: {gap:.3f}%")
+    if use_store and store.save_if_better(instance, optimized_path, name, "SArandom"):
+        print("Saved as the new best-known tour.")
     
     # Plot both paths for comparison
-    plot_path(coords, random_path, optimized_path)
+    if instance.points is not None:
+        output_file = render_comparison(instance.points, random_path, optimized_path, f"{name}_SArandom.png", 'Randomly Generated Salesman Path', 'Simulated Annealing Optimized Salesman Path')
+        print("Saved plot to", output_file)
 else:
-    print("Failed to read coordinates from the file.")
+    print("Failed to read the instance from the file.")
@@ -0,0 +1,137 @@
+import os
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from scipy.cluster.vq import kmeans2
+from tsplib import read_tsp_instance, as_instance, nearest_neighbor
+from local_search import two_opt
+
+# Function to split the cities into spatial regions of about region_size cities, returns a region label per city
+# "grid" cuts the bounding box into equal cells, "kmeans" follows the density of the cities
+def partition(points, region_size=1000, method="grid", seed=None):
+    n = len(points)
+    regions = max(1, -(-n // region_size))
+    if method == "kmeans":
+        _, labels = kmeans2(points, regions, minit="++", seed=seed)
+    elif method == "grid":
+        side = int(np.ceil(np.sqrt(regions)))
+        low = points.min(axis=0)
+        span = np.maximum(points.max(axis=0) - low, 1e-12)
+        cells = np.minimum(((points - low) / span * side).astype(np.int64), side - 1)
+        labels = cells[:, 0] * side + cells[:, 1]
+    else:
+        raise ValueError(f"Unknown partition method: {method}")
+    # Renumber so only non-empty regions are left, 0..regions-1
+    _, labels = np.unique(labels, return_inverse=True)
+    return labels
+
+# Function to solve one region with nearest neighbor + 2-opt (one job in the pool), returns its tour as an open array
+def _solve_region(region):
+    if len(region) <= 3:
+        return np.arange(len(region))
+    _, path = nearest_neighbor(region)
+    _, path = two_opt(region, path)
+    return np.array(path[:-1])
+
+# Function to order the regions along a short tour of their centroids
+def region_order(centroids):
+    if len(centroids) <= 3:
+        return np.arange(len(centroids))
+    _, path = nearest_neighbor(centroids)
+    _, path = two_opt(centroids, path)
+    return np.array(path[:-1])
+
+# Function to join the region tours into one tour, region by region along the centroid order
+# Each region's cycle is entered at the city closest to where the last region was left, and left at
+# whichever of the entry's two cycle neighbors is closer to the next region (that cycle edge is dropped).
+def stitch(points, members, tours, order, centroids):
+    path = []
+    exit_point = centroids[order[-1]]
+    for step, region in enumerate(order):
+        cities = members[region][tours[region]]
+        entry = int((((points[cities] - exit_point) ** 2).sum(axis=1)).argmin())
+        rotated = np.roll(cities, -entry)
+        if len(rotated) > 2:
+            next_centroid = centroids[order[(step + 1) % len(order)]]
+            forward_end = ((points[rotated[-1]] - next_centroid) ** 2).sum()
+            backward_end = ((points[rotated[1]] - next_centroid) ** 2).sum()
+            if backward_end < forward_end:
+                # Go around the other way so the path ends next to the following region
+                rotated = np.concatenate([rotated[:1], rotated[1:][::-1]])
+        path.extend(int(city) for city in rotated)
+        exit_point = points[rotated[-1]]
+    path.append(path[0])
+    return path
+
+# Function to find the cities next to a region boundary: a near neighbor in another region
+def boundary_cities(labels, neighbors):
+    return np.flatnonzero((labels[neighbors] != labels[:, None]).any(axis=1))
+
+# Spatial decomposition: partition, solve the regions in worker processes, stitch along the centroid tour,
+# then repair with 2-opt started from the boundary cities only. Returns (distance, path).
+def decomposition_solve(coords, region_size=1000, method="grid", workers=None, repair_passes=1, seed=None):
+    instance = as_instance(coords)
+    if instance.points is None or instance.weights is not None:
+        raise ValueError("Decomposition needs city coordinates, not an explicit distance matrix")
+    points = instance.points
+    n = len(points)
+    if n <= region_size:
+        return two_opt(instance, nearest_neighbor(instance)[1])
+
+    labels = partition(points, region_size, method, seed)
+    regions = labels.max() + 1
+    members = np.split(np.argsort(labels, kind="stable"), np.cumsum(np.bincount(labels, minlength=regions))[:-1])
+    centroids = np.array([points[cities].mean(axis=0) for cities in members])
+
+    workers = workers or os.cpu_count() or 1
+    subsets = [instance.subset(cities) for cities in members]
+    if workers == 1:
+        tours = list(map(_solve_region, subsets))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            tours = list(pool.map(_solve_region, subsets, chunksize=max(1, len(subsets) // (workers * 4))))
+
+    path = stitch(points, members, tours, region_order(centroids), centroids)
+
+    # Boundary repair: every region is already 2-opt optimal inside, only seams can be improved cheaply
+    neighbors = instance.neighbor_lists()
+    active = boundary_cities(labels, neighbors)
+    for _ in range(repair_passes):
+        distance, path = two_opt(instance, path, neighbors, active=active)
+    return instance.path_length(path), path
+
+# Main program
+if __name__ == "__main__":
+    from render import render_tour
+    from lower_bound import tour_gap
+
+    filename = input("Enter the filename: ").strip()
+    region_size = int(input("Enter cities per region (default 1000): ") or 1000)
+    method = input("Enter partition method, grid or kmeans (default grid): ").strip() or "grid"
+    workers = int(input("Enter number of workers (default all cores): ") or 0) or None
+    report_gap = input("Report the certified gap to the Held-Karp lower bound? (y/n): ").strip().lower() == "y"
+
+    print(f"Attempting to read file: {filename}")
+
+    instance = read_tsp_instance(filename)
+
+    if instance is not None and len(instance):
+        start_time = time.time()
+        best_distance, best_path = decomposition_solve(instance, region_size, method, workers, seed=42)
+        print("Name:", instance.name)
+        print("Dimension:", len(instance))
+        print("Edge Weight Type:", instance.edge_weight_type)
+        print("Total Distance (Decomposition):", best_distance)
+        if report_gap:
+            lower_bound, gap = tour_gap(instance, best_distance)
+            if lower_bound is None:
+                print("No certified lower bound for this instance.")
+            else:
+                print("Held-Karp Lower Bound:", lower_bound)
+                print(f"Certified Gap: {gap:.3f}%")
+        print("Elapsed time: %.2f seconds" % (time.time() - start_time))
+
+        output_file = render_tour(instance.points, best_path, f"{instance.name}_decompose.png", 'Decomposition Salesman Path')
+        print("Saved plot to", output_file)
+    else:
+        print("Failed to read the instance from the file.")
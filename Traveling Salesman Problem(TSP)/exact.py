@@ -0,0 +1,258 @@
+import time
+import numpy as np
+from tsplib import read_tsp_instance, as_instance, distance_matrix
+
+HELD_KARP_MAX_NODES = 20  # 2^19 subsets x 19 end nodes of float64 is about 80 MB
+
+# Held-Karp bitmask dp, node 0 is the fixed start so only subsets of the other n - 1 nodes are stored
+# dp[mask, j] is the shortest path from 0 through exactly the nodes in mask, ending at node j + 1
+def held_karp(dist):
+    n = len(dist)
+    if n <= 3:
+        path = list(range(n)) + [0]
+        return float(sum(dist[path[i - 1], path[i]] for i in range(1, len(path)))), path
+    if n > HELD_KARP_MAX_NODES:
+        raise ValueError(f"Held-Karp needs 2^(n-1) memory, use branch_and_bound for n > {HELD_KARP_MAX_NODES}")
+
+    m = n - 1
+    d = dist[1:, 1:]
+    dp = np.full((1 << m, m), np.inf)
+    dp[1 << np.arange(m), np.arange(m)] = dist[0, 1:]
+
+    # Process subsets layer by layer (by size), all masks in a layer at once for each end node
+    masks = np.arange(1 << m)
+    sizes = np.zeros(1 << m, dtype=np.int64)
+    for j in range(m):
+        sizes += (masks >> j) & 1
+    for size in range(2, m + 1):
+        layer = masks[sizes == size]
+        for j in range(m):
+            with_j = layer[((layer >> j) & 1) == 1]
+            previous = with_j ^ (1 << j)
+            # Best node k to come from before j
+            dp[with_j, j] = (dp[previous] + d[:, j]).min(axis=1)
+
+    full = (1 << m) - 1
+    closing = dp[full] + dist[1:, 0]
+    best_distance = float(closing.min())
+
+    # Walk back through the table to recover the path
+    path = []
+    mask, j = full, int(closing.argmin())
+    while mask:
+        path.append(j + 1)
+        previous = mask ^ (1 << j)
+        if previous == 0:
+            break
+        j = int((dp[previous] + d[:, j]).argmin())
+        mask = previous
+    path = [0] + path[::-1] + [0]
+    return best_distance, path
+
+# Function to compute a minimum spanning tree weight with Prim's algorithm on a dense weight matrix
+def mst_weight(weights):
+    n = len(weights)
+    if n <= 1:
+        return 0.0
+    in_tree = np.zeros(n, dtype=bool)
+    in_tree[0] = True
+    best = weights[0].copy()
+    total = 0.0
+    for _ in range(n - 1):
+        best[in_tree] = np.inf
+        k = int(best.argmin())
+        total += best[k]
+        in_tree[k] = True
+        best = np.minimum(best, weights[k])
+    return total
+
+# Function to compute the 1-tree (MST on nodes 1..n-1 plus the two cheapest edges at node 0) and node degrees
+def one_tree(weights):
+    n = len(weights)
+    degrees = np.zeros(n, dtype=np.int64)
+    in_tree = np.zeros(n, dtype=bool)
+    in_tree[0] = True
+    in_tree[1] = True
+    best = weights[1].copy()
+    parent = np.full(n, 1)
+    total = 0.0
+    for _ in range(n - 2):
+        best[in_tree] = np.inf
+        k = int(best.argmin())
+        total += best[k]
+        degrees[k] += 1
+        degrees[parent[k]] += 1
+        in_tree[k] = True
+        closer = weights[k] < best
+        best[closer] = weights[k][closer]
+        parent[closer] = k
+    # Two cheapest edges at node 0
+    edges = np.argsort(weights[0, 1:])[:2] + 1
+    total += weights[0, edges].sum()
+    degrees[0] += 2
+    degrees[edges] += 1
+    return total, degrees
+
+# Held-Karp node penalties by subgradient optimization, returns the best bound and its penalties
+def held_karp_penalties(dist, upper_bound, iterations=1000):
+    n = len(dist)
+    pi = np.zeros(n)
+    best_bound, best_pi = -np.inf, pi.copy()
+    step_scale = 2.0
+    stall = 0
+    for _ in range(iterations):
+        weights = dist + pi[:, None] + pi[None, :]
+        np.fill_diagonal(weights, np.inf)
+        tree_weight, degrees = one_tree(weights)
+        bound = tree_weight - 2 * pi.sum()
+        if bound > best_bound + 1e-9:
+            best_bound, best_pi = bound, pi.copy()
+            stall = 0
+        else:
+            stall += 1
+            if stall >= 20:
+                step_scale /= 2  # Halve the step when the bound stops improving
+                stall = 0
+        subgradient = degrees - 2
+        norm = (subgradient ** 2).sum()
+        if norm == 0 or step_scale < 1e-6:
+            break  # The 1-tree is a tour, the bound is exact
+        pi += step_scale * (upper_bound - bound) / norm * subgradient
+    return best_bound, best_pi
+
+# Function to get a starting tour: nearest neighbor polished by 2-opt, best over a few start nodes
+def initial_tour(dist, starts=10):
+    n = len(dist)
+    best_distance, best_path = np.inf, None
+    for start in np.linspace(0, n - 1, min(n, starts)).astype(int):
+        path = [int(start)]
+        unvisited = set(range(n)) - {int(start)}
+        while unvisited:
+            current = path[-1]
+            nearest = min(unvisited, key=lambda j: dist[current, j])
+            path.append(nearest)
+            unvisited.remove(nearest)
+        path.append(path[0])
+        improved = True
+        while improved:
+            improved = False
+            for i in range(1, n - 1):
+                for k in range(i + 1, n):
+                    a, b, c, e = path[i - 1], path[i], path[k], path[k + 1]
+                    if dist[a, c] + dist[b, e] < dist[a, b] + dist[c, e] - 1e-12:
+                        path[i:k + 1] = path[i:k + 1][::-1]
+                        improved = True
+        distance = float(sum(dist[path[i - 1], path[i]] for i in range(1, len(path))))
+        if distance < best_distance:
+            best_distance, best_path = distance, path
+    # Rotate so the tour starts at node 0 like the branch and bound paths
+    zero = best_path.index(0)
+    best_path = best_path[zero:-1] + best_path[:zero] + [0]
+    return best_distance, best_path
+
+# Depth-first branch and bound over paths from node 0
+# Bound for a partial path: its cost + MST of the unvisited nodes + cheapest links to them from both path ends,
+# all in the Held-Karp penalized weights so the bound is close to the 1-tree bound at the root.
+# Returns (best distance, best path, lower bound); the tour is proven optimal when the two are equal.
+def branch_and_bound(dist, time_limit=60.0, upper_bound=None, path=None):
+    start_time = time.time()
+    n = len(dist)
+    if n <= 3:
+        distance, path = held_karp(dist)
+        return distance, path, distance
+    if upper_bound is None:
+        upper_bound, path = initial_tour(dist)
+
+    root_bound, pi = held_karp_penalties(dist, upper_bound)
+    offset = 2 * pi.sum()  # Every tour costs exactly this much more in the penalized weights
+    weights = dist + pi[:, None] + pi[None, :]
+    np.fill_diagonal(weights, np.inf)
+    tol = 1e-7 * max(1.0, upper_bound)
+
+    best_distance, best_path = upper_bound, list(path)
+    if root_bound >= best_distance - tol:
+        return best_distance, best_path, best_distance
+
+    def bound(partial, cost, unvisited):
+        remaining = np.flatnonzero(unvisited)
+        if len(remaining) == 0:
+            return cost + weights[partial[-1], 0]
+        sub = weights[np.ix_(remaining, remaining)]
+        return (cost + mst_weight(sub) + weights[partial[-1], remaining].min() + weights[remaining, 0].min())
+
+    unvisited = np.ones(n, dtype=bool)
+    unvisited[0] = False
+    # Stack entries: (lower bound, partial path, penalized cost so far, unvisited mask)
+    stack = [(root_bound + offset, [0], 0.0, unvisited)]
+    timed_out = False
+    while stack:
+        if time.time() - start_time > time_limit:
+            timed_out = True
+            break
+        node_bound, partial, cost, unvisited = stack.pop()
+        if node_bound - offset >= best_distance - tol:
+            continue
+        last = partial[-1]
+        if not unvisited.any():
+            total = cost + weights[last, 0] - offset
+            if total < best_distance - tol:
+                best_distance, best_path = total, partial + [0]
+            continue
+        children = []
+        for nxt in np.flatnonzero(unvisited):
+            child_unvisited = unvisited.copy()
+            child_unvisited[nxt] = False
+            child_partial = partial + [int(nxt)]
+            child_cost = cost + weights[last, nxt]
+            child_bound = bound(child_partial, child_cost, child_unvisited)
+            if child_bound - offset < best_distance - tol:
+                children.append((child_bound, child_partial, child_cost, child_unvisited))
+        # Push the most promising child last so it's explored first
+        children.sort(key=lambda child: -child[0])
+        stack.extend(children)
+
+    # The search adds up penalized weights, so the length is summed again in the real distances
+    # (on integer instances the penalized sum comes out like 27602.999999999996)
+    best_distance = float(sum(dist[best_path[i - 1], best_path[i]] for i in range(1, len(best_path))))
+    if timed_out:
+        lower_bound = min([best_distance] + [entry[0] - offset for entry in stack])
+        lower_bound = max(lower_bound, root_bound)
+        if lower_bound >= best_distance - tol:
+            lower_bound = best_distance
+    else:
+        lower_bound = best_distance
+    return best_distance, best_path, float(min(lower_bound, best_distance))
+
+# Exact solve: Held-Karp for small instances, branch and bound with a time limit for larger ones
+def solve_exact(coords, time_limit=60.0):
+    dist = distance_matrix(as_instance(coords))
+    if len(dist) <= HELD_KARP_MAX_NODES:
+        distance, path = held_karp(dist)
+        return distance, path, distance
+    return branch_and_bound(dist, time_limit)
+
+# Main program
+if __name__ == "__main__":
+    filename = input("Enter the filename: ").strip()
+    time_limit = float(input("Enter time limit in seconds (default 60): ") or 60)
+
+    print(f"Attempting to read file: {filename}")
+
+    instance = read_tsp_instance(filename)
+
+    if instance is not None and len(instance):
+        start_time = time.time()
+        best_distance, best_path, lower_bound = solve_exact(instance, time_limit)
+        print("Name:", instance.name)
+        print("Dimension:", len(instance))
+        print("Edge Weight Type:", instance.edge_weight_type)
+        print("Best Path:", best_path)
+        print("Best Total Distance:", best_distance)
+        print("Lower Bound:", lower_bound)
+        if best_distance - lower_bound <= 1e-7 * max(1.0, best_distance):
+            print("Proven optimal.")
+        else:
+            print(f"Gap: {(best_distance - lower_bound) / best_distance * 100:.3f}%")
+        print("Elapsed time: %.2f seconds" % (time.time() - start_time))
+    else:
+        print("Failed to read the instance from the file.")
@@ -0,0 +1,169 @@
+import os
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from tsplib import read_tsp_instance, as_instance, nearest_neighbor, generate_random_path
+from local_search import two_opt, neighbor_lists
+
+# Instance and neighbor lists, set once per worker process instead of sent with every job
+_instance = None
+_neighbors = None
+
+def _init_worker(instance, neighbors):
+    global _instance, _neighbors
+    _instance = instance
+    _neighbors = neighbors
+
+# Function to polish an open tour with 2-opt, returns (distance, open tour)
+def _polish(tour):
+    distance, path = two_opt(_instance, list(tour) + [int(tour[0])], _neighbors)
+    return distance, np.array(path[:-1])
+
+# Order crossover (OX): keep a slice of the first parent, fill the rest in the second parent's order
+def order_crossover(parent1, parent2, rng):
+    n = len(parent1)
+    i, j = np.sort(rng.choice(n + 1, 2, replace=False))
+    taken = np.zeros(n, dtype=bool)
+    taken[parent1[i:j]] = True
+    rest = np.roll(parent2, -j)
+    rest = rest[~taken[rest]]
+    child = np.empty(n, dtype=parent1.dtype)
+    child[i:j] = parent1[i:j]
+    child[j:] = rest[:n - j]
+    child[:i] = rest[n - j:]
+    return child
+
+# Double-bridge mutation: reconnect four segments as A C B D, a change 2-opt can't undo by itself
+def double_bridge(tour, rng):
+    a, b, c = np.sort(rng.choice(np.arange(1, len(tour)), 3, replace=False))
+    return np.concatenate([tour[:a], tour[b:c], tour[a:b], tour[c:]])
+
+# Function to build an island's first population: a few nearest neighbor tours, the rest random, all polished
+def _seed_population(population_size, seed):
+    n = len(_instance)
+    population = []
+    nn_count = max(1, population_size // 4)
+    starts = np.random.default_rng(seed).choice(n, min(n, nn_count), replace=False)
+    for start in starts:
+        _, path = nearest_neighbor(_instance, int(start))
+        population.append(_polish(path[:-1]))
+    for k in range(population_size - len(population)):
+        _, path = generate_random_path(_instance, seed=seed * 1000 + k)
+        population.append(_polish(path[:-1]))
+    return population
+
+# Function to evolve one island for a number of generations (one job in the pool)
+# Steady state: each child replaces the worst tour if it's better and not already in the population.
+def _run_island(population, population_size, generations, mutation_rate, seed):
+    rng = np.random.default_rng(seed)
+    if population is None:
+        population = _seed_population(population_size, seed)
+    distances = np.array([distance for distance, _ in population])
+    tours = [tour for _, tour in population]
+    for _ in range(generations * len(tours)):
+        # Binary tournaments for both parents
+        first, second = (min(rng.choice(len(tours), 2, replace=False), key=lambda k: distances[k]) for _ in range(2))
+        child = order_crossover(tours[first], tours[second], rng)
+        if rng.random() < mutation_rate:
+            child = double_bridge(child, rng)
+        distance, child = _polish(child)
+        worst = int(distances.argmax())
+        if distance < distances[worst] and np.abs(distances - distance).min() > 1e-9:
+            distances[worst] = distance
+            tours[worst] = child
+    return list(zip(distances.tolist(), tours))
+
+# Function to move each island's best tours to the next island in the ring, replacing its worst
+def migrate(populations, migrants):
+    best = [sorted(population, key=lambda entry: entry[0])[:migrants] for population in populations]
+    for island, population in enumerate(populations):
+        population.sort(key=lambda entry: entry[0])
+        incoming = [entry for entry in best[island - 1] if all(abs(entry[0] - other[0]) > 1e-9 for other in population)]
+        if incoming:
+            population[-len(incoming):] = incoming
+    return populations
+
+# Island-model genetic algorithm: islands evolve in separate processes and exchange elite tours
+# every migration_interval generations. progress, if given, is called as progress(epoch, epochs, best distance)
+# after each migration epoch. Returns (distance, path) like the other solvers.
+def genetic_algorithm(coords, islands=4, population_size=20, generations=50, migration_interval=10, migrants=2, mutation_rate=0.2, workers=None, seed=None, time_limit=None, progress=None):
+    start_time = time.time()
+    instance = as_instance(coords)
+    neighbors = neighbor_lists(instance)
+    if len(instance) < 8:
+        return two_opt(instance, nearest_neighbor(instance)[1], neighbors)
+
+    rng = np.random.default_rng(seed)
+    workers = min(islands, workers or os.cpu_count() or 1)
+    populations = [None] * islands
+    epochs = -(-generations // migration_interval)
+
+    def run_epoch(run, epoch):
+        lengths = min(migration_interval, generations - epoch * migration_interval)
+        seeds = rng.integers(0, 2 ** 31, islands)
+        return list(run(_run_island, populations, [population_size] * islands, [lengths] * islands, [mutation_rate] * islands, seeds.tolist()))
+
+    if workers == 1:
+        # One core, skip the pool and run the islands one after another
+        _init_worker(instance, neighbors)
+        run = lambda fn, *args: map(fn, *args)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(instance, neighbors))
+        run = pool.map
+    try:
+        for epoch in range(epochs):
+            populations = run_epoch(run, epoch)
+            if progress is not None:
+                progress(epoch + 1, epochs, min(entry[0] for population in populations for entry in population))
+            if time_limit is not None and time.time() - start_time > time_limit:
+                break
+            populations = migrate(populations, migrants)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    best_distance, best_tour = min((entry for population in populations for entry in population), key=lambda entry: entry[0])
+    path = [int(city) for city in best_tour]
+    path.append(path[0])
+    return best_distance, path
+
+# Main program
+if __name__ == "__main__":
+    from render import render_comparison
+    from lower_bound import tour_gap
+
+    filename = input("Enter the filename: ").strip()
+    islands = int(input("Enter number of islands (default 4): ") or 4)
+    generations = int(input("Enter number of generations (default 50): ") or 50)
+    workers = int(input("Enter number of workers (default all cores): ") or 0) or None
+    report_gap = input("Report the certified gap to the Held-Karp lower bound? (y/n): ").strip().lower() == "y"
+
+    print(f"Attempting to read file: {filename}")
+
+    instance = read_tsp_instance(filename)
+
+    if instance is not None and len(instance):
+        start_time = time.time()
+        nn_distance, nn_path = nearest_neighbor(instance)
+        best_distance, best_path = genetic_algorithm(instance, islands=islands, generations=generations, workers=workers, seed=42)
+        print("Name:", instance.name)
+        print("Dimension:", len(instance))
+        print("Edge Weight Type:", instance.edge_weight_type)
+        print("Total Distance (Nearest Neighbor):", nn_distance)
+        print("Genetic Algorithm Path:", best_path)
+        print("Total Distance (Genetic Algorithm):", best_distance)
+        if report_gap:
+            lower_bound, gap = tour_gap(instance, best_distance)
+            if lower_bound is None:
+                print("No certified lower bound for this instance.")
+            else:
+                print("Held-Karp Lower Bound:", lower_bound)
+                print(f"Certified Gap: {gap:.3f}%")
+        print("Elapsed time: %.2f seconds" % (time.time() - start_time))
+
+        if instance.points is not None:
+            output_file = render_comparison(instance.points, nn_path, best_path, f"{instance.name}_genetic.png", 'Nearest Neighbor Salesman Path', 'Genetic Algorithm Optimized Salesman Path')
+            print("Saved plot to", output_file)
+    else:
+        print("Failed to read the instance from the file.")
@@ -0,0 +1,89 @@
+from collections import deque
+import numpy as np
+from tsplib import as_instance
+
+# Function to find each city's k nearest neighbors, the only candidates a 2-opt move is tried with
+def neighbor_lists(coords, k=8):
+    return as_instance(coords).neighbor_lists(k)
+
+# Fast 2-opt: neighbor lists + don't-look bits on an array tour with a position index
+# A move that shortens the tour must add an edge (a, c) shorter than the edge (a, b) it removes at a,
+# so only a's closest neighbors are tried and the scan stops at the first one farther than b.
+# Cities whose edges changed go back on the queue, everything else is left alone. A move can also open one at
+# a city that wasn't touched, so rounds repeat until one finds nothing: over every city, or with active given
+# (e.g. region boundaries) over active plus the cities moves have touched.
+# Returns (distance, path) like two_opt in the scripts, with the path starting where it started.
+def two_opt(coords, path, neighbors=None, k=8, active=None):
+    instance = as_instance(coords)
+    start = path[0]
+    tour = np.array(path[:-1] if len(path) > 1 and path[0] == path[-1] else path, dtype=np.int64)
+    n = len(tour)
+    if n < 5:
+        closed = [int(c) for c in tour] + [int(tour[0])]
+        return instance.path_length(closed), closed
+    if neighbors is None:
+        neighbors = instance.neighbor_lists(k)
+    dist = instance.distance_function()
+    neighbor_list = neighbors.tolist()
+    position = np.empty(len(instance), dtype=np.int64)
+    position[tour] = np.arange(n)
+
+    # Reverse tour[i..j] (cyclic, inclusive), or the other side of the cycle if that one is shorter
+    def reverse(i, j):
+        length = (j - i) % n + 1
+        if 2 * length > n:
+            i, j = (j + 1) % n, (i - 1) % n
+            length = n - length
+        index = (i + np.arange(length)) % n
+        tour[index] = tour[index[::-1]]
+        position[tour[index]] = index
+
+    queued = np.zeros(len(instance), dtype=bool)
+    touched = np.zeros(len(instance), dtype=bool)
+    queue = deque()
+
+    # Try the moves at city a in both tour directions and apply the first improving one, True if it did
+    def improve(a):
+        for forward in (True, False):
+            i = int(position[a])
+            b = int(tour[(i + 1) % n] if forward else tour[i - 1])
+            d_ab = dist(a, b)
+            for c in neighbor_list[a]:
+                d_ac = dist(a, c)
+                if d_ac >= d_ab:
+                    break
+                j = int(position[c])
+                e = int(tour[(j + 1) % n] if forward else tour[j - 1])
+                if c == b or e == a:
+                    continue
+                if d_ac + dist(b, e) < d_ab + dist(c, e) - 1e-10:
+                    # Replace (a, b) and (c, e) with (a, c) and (b, e)
+                    if forward:
+                        reverse(i + 1, j)
+                    else:
+                        reverse(j, i - 1)
+                    for city in (a, b, c, e):
+                        touched[city] = True
+                        if not queued[city]:
+                            queued[city] = True
+                            queue.append(city)
+                    return True
+        return False
+    round_cities = tour if active is None else np.asarray(active, dtype=np.int64)
+    moves = 1
+    while moves:
+        moves = 0
+        queue.extend(int(c) for c in round_cities if not queued[c])
+        queued[round_cities] = True
+        while queue:
+            a = queue.popleft()
+            queued[a] = False
+            moves += improve(a)
+        if active is not None:
+            round_cities = np.flatnonzero(touched)
+
+    # Rotate back so the path starts at the same city as the input
+    shift = int(position[start])
+    closed = [int(c) for c in np.roll(tour, -shift)]
+    closed.append(closed[0])
+    return instance.path_length(closed), closed
@@ -0,0 +1,254 @@
+import time
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.csgraph import minimum_spanning_tree
+from scipy.spatial import cKDTree, Delaunay
+from tsplib import read_tsp_instance, as_instance, nearest_neighbor
+
+# The bound is computed in the instance's own metric (EUC_2D rounds, ATT scales, ...), so it holds for the
+# tour lengths the solvers report. For the coordinate metrics below the distance d never decreases as the plain
+# Euclidean distance e grows and d >= scale * e - slack: EUC_2D rounds down by at most 0.5, CEIL_2D only rounds
+# up and ATT is at least e / sqrt(10). That's what lets the certification search the plane with a KD-tree.
+PLANAR_METRICS = {
+    "EUCLIDEAN": (1.0, 0.0),
+    "EUC_2D": (1.0, 0.5),
+    "CEIL_2D": (1.0, 0.0),
+    "ATT": (1.0 / np.sqrt(10.0), 0.0),
+}
+DENSE_MAX_NODES = 3000  # GEO and EXPLICIT have no such envelope, they're certified over the full graph up to this size
+
+def is_planar(instance):
+    return instance.weights is None and instance.edge_weight_type in PLANAR_METRICS
+
+# Every TSPLIB distance type but the plain EUCLIDEAN one is integer valued, so are the stored integer matrices
+def is_integer_metric(instance):
+    if instance.weights is not None:
+        return np.issubdtype(instance.weights.dtype, np.integer)
+    return instance.edge_weight_type != "EUCLIDEAN"
+
+# Function to build the sparse candidate graph: k nearest neighbors plus the Delaunay edges (keeps it connected)
+# Without planar coordinates it's the k nearest neighbors plus the MST edges of every node but node 0 instead.
+# Returns the edge endpoints (i < j, no duplicates) and their lengths in the instance metric
+def candidate_edges(coords, k=8):
+    instance = as_instance(coords)
+    n = len(instance)
+    k = min(k, n - 1)
+    if not is_planar(instance):
+        if n > DENSE_MAX_NODES:
+            raise ValueError(f"No certified bound for {instance.edge_weight_type} instances above {DENSE_MAX_NODES} cities")
+        rows = np.repeat(np.arange(n), k)
+        cols = instance.neighbor_lists(k).reshape(-1)
+        # The MST leaves out node 0, the 1-tree's special node, so the other nodes stay connected without it
+        # even where node 0 is the only link between two clusters (its own edges come from the neighbor lists)
+        matrix = instance.distance_matrix()[1:, 1:] + 1.0  # Shifted so zero distances aren't read as missing edges
+        np.fill_diagonal(matrix, 0.0)
+        tree = minimum_spanning_tree(matrix).tocoo()
+        return _unique_edges(instance, np.concatenate([rows, tree.row + 1]), np.concatenate([cols, tree.col + 1]))
+    points = instance.points
+    _, neighbors = cKDTree(points).query(points, k + 1)
+    rows = np.repeat(np.arange(n), k)
+    cols = neighbors[:, 1:].reshape(-1)
+    if n >= 4:
+        try:
+            triangles = Delaunay(points).simplices
+            rows = np.concatenate([rows, triangles[:, 0], triangles[:, 1], triangles[:, 2]])
+            cols = np.concatenate([cols, triangles[:, 1], triangles[:, 2], triangles[:, 0]])
+        except Exception:
+            pass  # Collinear points, the kNN edges will have to do
+    return _unique_edges(instance, rows, cols)
+
+def _unique_edges(instance, rows, cols):
+    lo, hi = np.minimum(rows, cols), np.maximum(rows, cols)
+    keep = lo != hi
+    edges = np.unique(np.stack([lo[keep], hi[keep]], axis=1), axis=0)
+    return edges[:, 0], edges[:, 1], instance.distances(edges[:, 0], edges[:, 1])
+
+# Function to compute the 1-tree over the candidate edges with penalties pi
+# The MST spans every node except special, which is joined by its two cheapest edges.
+# Returns (1-tree weight in penalized weights, node degrees, largest MST edge) or None if the graph isn't connected.
+def sparse_one_tree(n, u, v, lengths, pi, special=0):
+    weights = lengths + pi[u] + pi[v]
+    at_special = (u == special) | (v == special)
+    # csgraph treats zero entries as missing, so shift every weight above zero (the tree has n - 2 edges either way)
+    shift = 1.0 - weights[~at_special].min()
+    graph = sp.csr_matrix((weights[~at_special] + shift, (u[~at_special], v[~at_special])), shape=(n, n))
+    tree = minimum_spanning_tree(graph).tocoo()
+    if tree.nnz != n - 2:
+        return None
+    degrees = np.bincount(tree.row, minlength=n) + np.bincount(tree.col, minlength=n)
+    tree_weight = tree.data.sum() - shift * (n - 2)
+    largest_edge = tree.data.max() - shift
+    # Two cheapest edges at the special node
+    special_weights = np.sort(weights[at_special])[:2]
+    special_ends = np.where(u[at_special] == special, v[at_special], u[at_special])[np.argsort(weights[at_special])[:2]]
+    degrees[special] += 2
+    degrees[special_ends] += 1
+    return tree_weight + special_weights.sum(), degrees, largest_edge
+
+# Held-Karp 1-tree lower bound by subgradient optimization over a sparse candidate graph
+# coords is an array of points or a TSPInstance, upper_bound is any tour length (it only sets the step size).
+# Returns (lower bound, penalties pi).
+def held_karp_bound(coords, upper_bound, k=8, iterations=300, time_limit=None, verbose=False):
+    start_time = time.time()
+    instance = as_instance(coords)
+    n = len(instance)
+    if n < 3:
+        return upper_bound, np.zeros(n)
+    u, v, lengths = candidate_edges(instance, k)
+    pi = np.zeros(n)
+    best_bound, best_pi = -np.inf, pi.copy()
+    step_scale = 2.0
+    stall = 0
+    for iteration in range(iterations):
+        result = sparse_one_tree(n, u, v, lengths, pi)
+        if result is None:
+            raise ValueError("Candidate graph is not connected, raise k")
+        tree_weight, degrees, _ = result
+        bound = tree_weight - 2 * pi.sum()
+        if bound > best_bound + 1e-9:
+            best_bound, best_pi = bound, pi.copy()
+            stall = 0
+        else:
+            stall += 1
+            if stall >= 20:
+                step_scale /= 2  # Halve the step when the bound stops improving
+                stall = 0
+        if verbose:
+            print(f"Iteration {iteration}: bound = {bound:.2f}, best = {best_bound:.2f}")
+        subgradient = degrees - 2
+        norm = float((subgradient ** 2).sum())
+        if norm == 0 or step_scale < 1e-6:
+            break  # The 1-tree is a tour, nothing left to gain
+        if time_limit is not None and time.time() - start_time > time_limit:
+            break
+        pi += step_scale * (upper_bound - bound) / norm * subgradient
+
+    return certify_bound(instance, best_pi, u, v, lengths, k), best_pi
+
+# Function to turn penalties into a bound that holds for the full graph, not just the candidate edges
+# The candidate MST is the full-graph MST if no missing edge is lighter than the tree's largest edge B.
+# A missing edge (i, j) is at least as long as i's k-th neighbor distance r_i (in the metric, scale * r_i - slack),
+# so it can only be lighter than B if r_i + pi_i + pi_j < B. Nodes are grouped by penalty so each radius search
+# uses its group's smallest pi_j, and the edges that really are lighter than B get added before the tree is recomputed.
+def certify_bound(coords, pi, u, v, lengths, k=8, special=0, groups=32, max_checked_edges=50_000_000):
+    instance = as_instance(coords)
+    n = len(instance)
+    if not is_planar(instance):
+        # Small enough to take the 1-tree over every edge
+        rows, cols = np.triu_indices(n, 1)
+        result = sparse_one_tree(n, rows, cols, instance.distances(rows, cols), pi, special)
+        return float(result[0] - 2 * pi.sum())
+    scale, slack = PLANAR_METRICS[instance.edge_weight_type]
+    points = instance.points
+    result = sparse_one_tree(n, u, v, lengths, pi, special)
+    largest_edge = result[2]
+    kth, _ = cKDTree(points).query(points, min(n, k + 1))
+    covered = scale * kth[:, -1] - slack  # Every neighbor closer than this is already a candidate edge
+
+    extra_rows, extra_cols, checked = [], [], 0
+    for group in np.array_split(np.argsort(pi), min(groups, n)):
+        lowest = pi[group].min()
+        unsafe = np.flatnonzero(covered + pi + lowest < largest_edge)
+        if len(unsafe) == 0:
+            continue
+        group_tree = cKDTree(points[group])
+        radii = (largest_edge - pi[unsafe] - lowest + slack) / scale
+        checked += int(group_tree.query_ball_point(points[unsafe], radii, return_length=True).sum())
+        if checked > max_checked_edges:
+            # Too many edges to check, fall back to the plain MST of the Delaunay graph (always exact for these metrics)
+            return mst_bound(instance)
+        neighbors = group_tree.query_ball_point(points[unsafe], radii)
+        rows = np.repeat(unsafe, [len(nb) for nb in neighbors])
+        cols = group[np.fromiter((j for nb in neighbors for j in nb), dtype=np.int64, count=len(rows))]
+        # Keep only edges that beat the largest tree edge in the penalized weights
+        weights = instance.distances(rows, cols) + pi[rows] + pi[cols]
+        lighter = (weights < largest_edge) & (rows != cols)
+        extra_rows.append(rows[lighter])
+        extra_cols.append(cols[lighter])
+    if extra_rows and sum(len(r) for r in extra_rows):
+        u, v, lengths = _unique_edges(instance, np.concatenate([u] + extra_rows), np.concatenate([v] + extra_cols))
+        result = sparse_one_tree(n, u, v, lengths, pi, special)
+
+    # The special node's two cheapest edges need the same care, check it against every node directly
+    special_lengths = instance.row(special) + pi + pi[special]
+    special_lengths[special] = np.inf
+    at_special = (u == special) | (v == special)
+    candidate_special = np.sort(lengths[at_special] + pi[u[at_special]] + pi[v[at_special]])[:2].sum()
+    exact_special = np.sort(special_lengths)[:2].sum()
+    return float(result[0] - candidate_special + exact_special - 2 * pi.sum())
+
+# Function to compute the plain MST weight over the Delaunay graph, a weaker bound that needs no penalties
+# The planar metrics only grow with the Euclidean distance, so the Euclidean MST is an MST in them too
+def mst_bound(coords):
+    instance = as_instance(coords)
+    u, v, lengths = candidate_edges(instance, k=1)
+    n = len(instance)
+    graph = sp.csr_matrix((np.sqrt(((instance.points[u] - instance.points[v]) ** 2).sum(axis=1)) + 1.0, (u, v)), shape=(n, n))
+    tree = minimum_spanning_tree(graph).tocoo()
+    return float(instance.distances(tree.row, tree.col).sum())
+
+# Function to report the certified gap of a tour against the lower bound (in percent)
+def certified_gap(tour_distance, lower_bound):
+    return (tour_distance - lower_bound) / tour_distance * 100 if tour_distance > 0 else 0.0
+
+# Function to bound an instance and get a solver's certified gap, returns (lower bound, gap in percent)
+# or (None, None) if the instance can't be certified (GEO or EXPLICIT above DENSE_MAX_NODES cities).
+# Integer metrics round the bound up, every tour length is an integer too (the tolerance absorbs the float noise).
+def tour_gap(coords, tour_distance, iterations=300, time_limit=None):
+    instance = as_instance(coords)
+    try:
+        lower_bound, _ = held_karp_bound(instance, tour_distance, iterations=iterations, time_limit=time_limit)
+    except ValueError:
+        return None, None
+    if is_integer_metric(instance):
+        lower_bound = float(np.ceil(lower_bound - 1e-9 * max(1.0, abs(lower_bound))))
+    return lower_bound, certified_gap(tour_distance, lower_bound)
+
+# Function to get a quick tour length for the step size: visit the cities along a Hilbert curve
+# (nearest neighbor when there are no planar coordinates to order)
+def quick_upper_bound(coords, order=16):
+    instance = as_instance(coords)
+    if not is_planar(instance):
+        return nearest_neighbor(instance)[0]
+    points = instance.points
+    side = 1 << order
+    span = np.maximum(points.max(axis=0) - points.min(axis=0), 1e-12)
+    x, y = ((points - points.min(axis=0)) / span * (side - 1)).astype(np.int64).T
+    d = np.zeros(len(points), dtype=np.int64)
+    s = side // 2
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        d += s * s * ((3 * rx) ^ ry)
+        # Rotate the quadrant so the curve stays continuous
+        flip = ~ry & rx
+        x = np.where(flip, side - 1 - x, x)
+        y = np.where(flip, side - 1 - y, y)
+        x, y = np.where(~ry, y, x), np.where(~ry, x, y)
+        s //= 2
+    tour = np.append(np.argsort(d), np.argsort(d)[0])
+    return instance.path_length(tour)
+
+# Main program
+if __name__ == "__main__":
+    filename = input("Enter the filename: ").strip()
+    tour_distance = input("Enter a tour length to check (leave empty to skip): ").strip()
+    iterations = int(input("Enter subgradient iterations (default 300): ") or 300)
+
+    print(f"Attempting to read file: {filename}")
+
+    instance = read_tsp_instance(filename)
+
+    if instance is not None and len(instance):
+        start_time = time.time()
+        upper_bound = float(tour_distance) if tour_distance else quick_upper_bound(instance)
+        lower_bound, _ = held_karp_bound(instance, upper_bound, iterations=iterations, verbose=True)
+        print("Name:", instance.name)
+        print("Dimension:", len(instance))
+        print("Edge Weight Type:", instance.edge_weight_type)
+        print("Held-Karp Lower Bound:", lower_bound)
+        print("Tour Length:", upper_bound, "(given)" if tour_distance else "(space-filling curve)")
+        print(f"Certified Gap: {certified_gap(upper_bound, lower_bound):.3f}%")
+        print("Elapsed time: %.2f seconds" % (time.time() - start_time))
+    else:
+        print("Failed to read the instance from the file.")
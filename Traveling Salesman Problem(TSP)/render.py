@@ -0,0 +1,88 @@
+import time
+import numpy as np
+import matplotlib
+matplotlib.use("Agg")  # Write files, no window needed (works on headless servers)
+import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from tsplib import read_tsp_instance, as_points
+
+MARKER_LIMIT = 5000  # Above this many cities the markers would just cover the path, draw the line only
+RASTER_LIMIT = 20000  # Above this many edges an SVG rasterizes the path so the file stays small
+
+# Function to turn a path into an (edges, 2, 2) array of segment endpoints for a LineCollection
+def tour_segments(points, path):
+    path = np.asarray(path)
+    return np.stack([points[path[:-1]], points[path[1:]]], axis=1)
+
+# Function to pick marker size and line width for the number of cities
+# Small tours look like the old plots, larger ones get smaller markers and thinner lines, huge ones no markers
+def marker_style(n):
+    if n <= 200:
+        return 4.0, 1.0
+    if n <= MARKER_LIMIT:
+        return max(0.5, 4.0 * (200 / n) ** 0.5), 0.5
+    return 0.0, max(0.1, 0.5 * (MARKER_LIMIT / n) ** 0.5)
+
+# Function to draw one tour on an axis as a single line collection
+def draw_tour(ax, points, path, title, color='b'):
+    segments = tour_segments(points, path)
+    marker_size, line_width = marker_style(len(points))
+    lines = LineCollection(segments, colors=color, linewidths=line_width)
+    lines.set_rasterized(len(segments) > RASTER_LIMIT)
+    ax.add_collection(lines)
+    if marker_size > 0:
+        ax.plot(points[:, 0], points[:, 1], linestyle='none', marker='o', markersize=marker_size, color=color)
+    ax.autoscale_view()
+    ax.set_title(title)
+    ax.set_xlabel('X Coordinate')
+    ax.set_ylabel('Y Coordinate')
+    ax.legend([lines], ['Path'], loc='best')
+    ax.grid(True)
+
+# Function to write a single tour to an image file (the format comes from the extension, .png or .svg)
+def render_tour(coords, path, filename, title="Salesman Path", dpi=150):
+    points = as_points(coords)
+    fig, ax = plt.subplots(figsize=(10, 8))
+    draw_tour(ax, points, path, title)
+    fig.savefig(filename, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+    return filename
+
+# Function to write two tours side by side, like the scripts' initial vs optimized plots
+def render_comparison(coords, initial_path, optimized_path, filename, initial_title="Initial Salesman Path", optimized_title="Optimized Salesman Path", dpi=150):
+    points = as_points(coords)
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(20, 8))
+    draw_tour(ax1, points, initial_path, initial_title)
+    draw_tour(ax2, points, optimized_path, optimized_title)
+    fig.savefig(filename, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+    return filename
+
+# Main program, renders a .tour file (or the best stored tour) for an instance
+if __name__ == "__main__":
+    from tour_store import TourStore, read_tour_file
+
+    filename = input("Enter the filename: ").strip()
+    tour_filename = input("Enter a .tour file (leave empty for the best stored tour): ").strip()
+    output_file = input("Enter the output file (.png or .svg): ").strip() or "tour.png"
+
+    print(f"Attempting to read file: {filename}")
+
+    instance = read_tsp_instance(filename)
+
+    if instance is not None and instance.points is not None and len(instance):
+        points = instance.points
+        if tour_filename:
+            path = read_tour_file(tour_filename)
+        else:
+            stored = TourStore().load_best(instance)
+            path = stored[1] if stored is not None else []
+        if len(path) != len(points) + 1:
+            print("No tour of this instance to render.")
+        else:
+            start_time = time.time()
+            render_tour(points, path, output_file, title=f"{instance.name} Salesman Path")
+            print("Saved plot to", output_file)
+            print("Elapsed time: %.2f seconds" % (time.time() - start_time))
+    else:
+        print("Failed to read coordinates from the file.")
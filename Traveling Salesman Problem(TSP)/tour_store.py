@@ -0,0 +1,171 @@
+import os
+import json
+import time
+import hashlib
+import tempfile
+import numpy as np
+from tsplib import as_instance
+
+try:
+    import fcntl
+except ImportError:  # No file locking on Windows, saves are still atomic but not serialized
+    fcntl = None
+
+DEFAULT_STORE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tour_store")
+
+# Function to hash an instance by its coordinates, so renamed or moved files still find their tours.
+# Other TSPLIB distance types than plain EUCLIDEAN hash their type too (their tour lengths differ), explicit
+# matrices hash the distances themselves, a chunk at a time so a memory-mapped matrix isn't copied whole.
+def instance_key(coords):
+    instance = as_instance(coords)
+    digest = hashlib.sha256()
+    if instance.weights is not None:
+        digest.update(b"EXPLICIT")
+        for start in range(0, len(instance.weights), 1 << 20):
+            digest.update(np.ascontiguousarray(instance.weights[start:start + (1 << 20)], dtype=np.float64).tobytes())
+    else:
+        if instance.edge_weight_type != "EUCLIDEAN":
+            digest.update(instance.edge_weight_type.encode())
+        digest.update(np.ascontiguousarray(instance.points, dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+# Function to write a tour in TSPLIB .tour format (1-based node ids, closed by -1)
+def write_tour_file(filename, name, path, distance):
+    nodes = path[:-1] if len(path) > 1 and path[0] == path[-1] else path
+    lines = [f"NAME : {name}.tour", f"COMMENT : Length = {distance}", "TYPE : TOUR", f"DIMENSION : {len(nodes)}", "TOUR_SECTION"]
+    lines.extend(str(node + 1) for node in nodes)
+    lines.extend(["-1", "EOF"])
+    with open(filename, 'w') as file:
+        file.write("\n".join(lines) + "\n")
+
+# Function to read a TSPLIB .tour file back into a closed 0-based path
+def read_tour_file(filename):
+    path = []
+    with open(filename, 'r') as file:
+        in_tour_section = False
+        for line in file:
+            line = line.strip()
+            if line.startswith("TOUR_SECTION"):
+                in_tour_section = True
+            elif in_tour_section:
+                for part in line.split():
+                    if part == "-1":
+                        in_tour_section = False
+                        break
+                    path.append(int(part) - 1)
+    if path:
+        path.append(path[0])
+    return path
+
+# Function to write a file next to its final name and rename it over, readers never see a partial file
+def _atomic_write(filename, write):
+    directory = os.path.dirname(filename)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, filename)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def _write_json(filename, record):
+    with open(filename, 'w') as file:
+        json.dump(record, file, indent=2)
+
+# Local store of the best tour found so far for each instance, coords is a Coordinate list, an array of
+# points or a TSPInstance (lengths are in its own distances)
+class TourStore:
+    def __init__(self, directory=DEFAULT_STORE_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _paths(self, key):
+        base = os.path.join(self.directory, key)
+        return base + ".tour", base + ".json", base + ".lock"
+
+    # Best stored tour as (distance, closed path), or None if this instance has never been saved
+    def load_best(self, coords):
+        tour_file, meta_file, _ = self._paths(instance_key(coords))
+        if not os.path.exists(tour_file):
+            return None
+        path = read_tour_file(tour_file)
+        instance = as_instance(coords)
+        if len(path) != len(instance) + 1:
+            return None  # Doesn't match this instance, ignore it
+        return instance.path_length(path), path
+
+    # Run metadata of the stored tour (solver, length, when it was found, ...)
+    def load_metadata(self, coords):
+        _, meta_file, _ = self._paths(instance_key(coords))
+        if not os.path.exists(meta_file):
+            return None
+        with open(meta_file, 'r') as file:
+            return json.load(file)
+
+    # Save the tour if it beats the stored one, returns True when it was written
+    # The length is recomputed from the instance so a wrong distance can't overwrite a better tour
+    def save_if_better(self, coords, path, name="", solver="", metadata=None):
+        instance = as_instance(coords)
+        key = instance_key(instance)
+        tour_file, meta_file, lock_file = self._paths(key)
+        nodes = path[:-1] if path[0] == path[-1] else path
+        if sorted(nodes) != list(range(len(instance))):
+            raise ValueError("Path is not a tour of every city exactly once")
+        closed = list(nodes) + [nodes[0]]
+        distance = instance.path_length(closed)
+
+        with open(lock_file, 'w') as lock:
+            # Hold the lock between comparing and writing so parallel runs can't lose a better tour
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                stored = self.load_best(instance)
+                if stored is not None and stored[0] <= distance:
+                    return False
+                previous = self.load_metadata(instance) or {}
+                record = {
+                    "name": name,
+                    "dimension": len(instance),
+                    "length": distance,
+                    "solver": solver,
+                    "saved_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "improvements": previous.get("improvements", 0) + 1,
+                    "previous_length": previous.get("length"),
+                }
+                record.update(metadata or {})
+                _atomic_write(tour_file, lambda tmp: write_tour_file(tmp, name or key[:12], closed, distance))
+                _atomic_write(meta_file, lambda tmp: _write_json(tmp, record))
+                return True
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+# Function to pick the starting tour: the stored one if it's better than the given start
+def warm_start(store, coords, distance, path):
+    stored = store.load_best(coords)
+    if stored is not None and stored[0] < distance:
+        return stored
+    return distance, path
+
+# Main program, shows what's stored for an instance
+if __name__ == "__main__":
+    from tsplib import read_tsp_instance
+
+    filename = input("Enter the filename: ").strip()
+    instance = read_tsp_instance(filename)
+
+    if instance is not None and len(instance):
+        store = TourStore()
+        stored = store.load_best(instance)
+        print("Name:", instance.name)
+        print("Edge Weight Type:", instance.edge_weight_type)
+        print("Instance key:", instance_key(instance))
+        if stored is None:
+            print("No stored tour for this instance.")
+        else:
+            print("Best Stored Distance:", stored[0])
+            print("Metadata:", json.dumps(store.load_metadata(instance), indent=2))
+    else:
+        print("Failed to read the instance from the file.")
@@ -0,0 +1,439 @@
+import os
+import math
+import tempfile
+import numpy as np
+from scipy.spatial import cKDTree
+
+# Shared helpers for the TSP modules that need to import each other (the scripts all prompt on import)
+
+# Class to store the coordinates of a point
+class Coordinate:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+# Function to read a TSP file and extract the coordinates
+def read_tsp_file(filename):
+    coords = []
+    dimension_value = 0
+    name = ""
+
+    try:
+        with open(filename, 'r') as file:
+            in_node_section = False
+            for line in file:
+                line = line.strip()
+                if line.startswith("NAME"):
+                    # Extract the name of the problem
+                    name = line.split(":")[1].strip()
+                elif line.startswith("DIMENSION"):
+                    # Extract the number of nodes
+                    dimension_value = int(line.split(":")[1].strip())
+                elif line.startswith("NODE_COORD_SECTION"):
+                    # Start reading the coordinates
+                    in_node_section = True
+                elif in_node_section:
+                    parts = line.split()
+                    if len(parts) >= 3:
+                        # Extract and store the coordinates
+                        x, y = map(float, parts[1:3])
+                        coords.append(Coordinate(x, y))
+                    # Stop reading if we have reached the specified number of nodes
+                    if len(coords) == dimension_value:
+                        break
+        return name, dimension_value, coords
+    except FileNotFoundError:
+        print(f"Error: File {filename} not found.")
+        return None, None, []
+    except Exception as e:
+        print(f"Error reading file: {e}")
+        return None, None, []
+
+# Function to calculate the Euclidean distance between two points
+def calculate_distance(coord1, coord2):
+    return math.sqrt((coord1.x - coord2.x) ** 2 + (coord1.y - coord2.y) ** 2)
+
+# Function to turn the Coordinate list into an (n, 2) array
+def coords_to_array(coords):
+    return np.array([(c.x, c.y) for c in coords], dtype=float).reshape(-1, 2)
+
+# Function to build the full distance matrix, only for instances small enough to hold n x n floats
+def distance_matrix(points):
+    if isinstance(points, TSPInstance):
+        return points.distance_matrix()
+    diff = points[:, None, :] - points[None, :, :]
+    return np.sqrt((diff ** 2).sum(axis=2))
+
+# Function to calculate the total distance of a closed path (path[0] == path[-1]) from the array coordinates
+# (or in the instance's own distances when given a TSPInstance)
+def path_length(points, path):
+    if isinstance(points, TSPInstance):
+        return points.path_length(path)
+    path = np.asarray(path)
+    return float(np.sqrt(((points[path[1:]] - points[path[:-1]]) ** 2).sum(axis=1)).sum())
+
+# Function to accept either the Coordinate list or an (n, 2) array
+def as_points(coords):
+    return coords if isinstance(coords, np.ndarray) else coords_to_array(coords)
+
+# Nearest Neighbor on the array coordinates (or any TSPInstance), same result as the scripts' nearest_neighbor
+def nearest_neighbor(coords, start_node=0):
+    instance = as_instance(coords)
+    n = len(instance)
+    if n == 0:
+        return 0, []
+    unvisited = np.ones(n, dtype=bool)
+    unvisited[start_node] = False
+    path = [start_node]
+    current = start_node
+    for _ in range(n - 1):
+        # Distances from the current city to every city, visited ones masked out
+        distances = np.where(unvisited, instance.row(current), np.inf)
+        current = int(distances.argmin())
+        unvisited[current] = False
+        path.append(current)
+    path.append(path[0])
+    return instance.path_length(path), path
+
+# Function to generate a random path and calculate its total distance
+def generate_random_path(coords, seed=None):
+    instance = as_instance(coords)
+    path = [int(i) for i in np.random.default_rng(seed).permutation(len(instance))]
+    path.append(path[0])  # Return to the starting point to complete the loop
+    return instance.path_length(path), path
+
+# TSPLIB distance kernels (see the TSPLIB 95 spec), vectorized over the last axis of two coordinate arrays.
+# Every type except the plain EUCLIDEAN one the scripts use is integer valued.
+GEO_PI = 3.141592
+GEO_RADIUS = 6378.388
+
+def _nint(x):
+    return np.floor(x + 0.5)
+
+def euclidean_kernel(a, b):
+    return np.sqrt(((a - b) ** 2).sum(axis=-1))
+
+def euc_2d_kernel(a, b):
+    return _nint(euclidean_kernel(a, b))
+
+def ceil_2d_kernel(a, b):
+    return np.ceil(euclidean_kernel(a, b))
+
+def att_kernel(a, b):
+    r = np.sqrt(((a - b) ** 2).sum(axis=-1) / 10.0)
+    t = _nint(r)
+    return np.where(t < r, t + 1, t)
+
+# GEO coordinates are DDD.MM (degrees and minutes), converted once to radians before the kernel runs
+def geo_radians(points):
+    degrees = np.trunc(points)
+    return GEO_PI * (degrees + 5.0 * (points - degrees) / 3.0) / 180.0
+
+def geo_kernel(a, b):
+    q1 = np.cos(a[..., 1] - b[..., 1])
+    q2 = np.cos(a[..., 0] - b[..., 0])
+    q3 = np.cos(a[..., 0] + b[..., 0])
+    angle = np.arccos(np.clip(0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3), -1.0, 1.0))
+    return np.trunc(GEO_RADIUS * angle + 1.0)
+
+KERNELS = {
+    "EUCLIDEAN": euclidean_kernel,  # Unrounded, what the scripts and arrays of coordinates use
+    "EUC_2D": euc_2d_kernel,
+    "CEIL_2D": ceil_2d_kernel,
+    "ATT": att_kernel,
+    "GEO": geo_kernel,
+}
+
+# Function to build the same distance for a single pair of cities, plain Python for the 2-opt inner loops
+def _scalar_kernel(edge_weight_type, xs, ys):
+    hypot, sqrt, cos, acos = math.hypot, math.sqrt, math.cos, math.acos
+    if edge_weight_type == "EUCLIDEAN":
+        return lambda a, b: hypot(xs[a] - xs[b], ys[a] - ys[b])
+    if edge_weight_type == "EUC_2D":
+        return lambda a, b: float(int(hypot(xs[a] - xs[b], ys[a] - ys[b]) + 0.5))
+    if edge_weight_type == "CEIL_2D":
+        return lambda a, b: float(math.ceil(hypot(xs[a] - xs[b], ys[a] - ys[b])))
+    if edge_weight_type == "ATT":
+        def att(a, b):
+            r = sqrt(((xs[a] - xs[b]) ** 2 + (ys[a] - ys[b]) ** 2) / 10.0)
+            t = int(r + 0.5)
+            return float(t + 1 if t < r else t)
+        return att
+    def geo(a, b):
+        if a == b:
+            return 0.0
+        q1 = cos(ys[a] - ys[b])
+        q2 = cos(xs[a] - xs[b])
+        q3 = cos(xs[a] + xs[b])
+        return float(int(GEO_RADIUS * acos(max(-1.0, min(1.0, 0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3)))) + 1.0))
+    return geo
+
+# Function to find the position of edge (i, j), i < j, in the upper triangle stored row by row
+def condensed_index(n, i, j):
+    i = np.asarray(i, dtype=np.int64)
+    return i * n - i * (i + 1) // 2 + np.asarray(j, dtype=np.int64) - i - 1
+
+EXPLICIT_MEMMAP_ENTRIES = 10_000_000  # Upper triangles bigger than this (40 MB of int32) go to a memory-mapped file
+
+# A TSP instance with its TSPLIB distance function: coordinates plus a kernel, or an EXPLICIT matrix
+# stored as its upper triangle (n (n - 1) / 2 entries, memory-mapped for large instances)
+# An instance read into a memory-mapped file owns it: close() (or leaving a with block, or garbage collection)
+# deletes the file. Worker processes reopen it by name, so only the process that created it deletes it.
+class TSPInstance:
+    def __init__(self, name, edge_weight_type, points=None, weights=None, dimension=None):
+        self.name = name
+        self.edge_weight_type = edge_weight_type
+        self.points = points
+        self.weights = weights
+        self.weights_owner = None  # Process id that deletes the memory-mapped weights file
+        self.dimension = dimension if dimension is not None else len(points)
+        if weights is None:
+            if edge_weight_type not in KERNELS:
+                raise ValueError(f"Unsupported EDGE_WEIGHT_TYPE: {edge_weight_type}")
+            self.prepared = geo_radians(points) if edge_weight_type == "GEO" else points
+
+    def __len__(self):
+        return self.dimension
+
+    # Function to delete the memory-mapped weights file, the open mapping stays readable until it's dropped
+    def close(self):
+        if getattr(self, "weights_owner", None) == os.getpid() and isinstance(self.weights, np.memmap):
+            self.weights_owner = None
+            try:
+                os.unlink(self.weights.filename)
+            except FileNotFoundError:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    # Memory-mapped weights are sent to worker processes as their file name, not copied
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["weights_owner"] = None
+        if isinstance(self.weights, np.memmap):
+            state["weights"] = self.weights.filename
+        return state
+
+    def __setstate__(self, state):
+        if isinstance(state["weights"], str):
+            state["weights"] = np.load(state["weights"], mmap_mode="r")
+        self.__dict__.update(state)
+
+    # Distances between the cities rows[k] and cols[k]
+    def distances(self, rows, cols):
+        rows, cols = np.broadcast_arrays(np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64))
+        same = rows == cols
+        if self.weights is None:
+            distances = KERNELS[self.edge_weight_type](self.prepared[rows], self.prepared[cols])
+        else:
+            lo, hi = np.minimum(rows, cols), np.maximum(rows, cols)
+            index = np.where(same, 0, condensed_index(self.dimension, lo, hi))
+            distances = np.asarray(self.weights[index], dtype=float)
+        return np.where(same, 0.0, distances)
+
+    # Distances from city i to every city
+    def row(self, i):
+        if self.weights is not None:
+            return self.distances(i, np.arange(self.dimension))
+        distances = KERNELS[self.edge_weight_type](self.prepared[i], self.prepared)
+        distances[i] = 0.0
+        return distances
+
+    def distance_matrix(self):
+        n = self.dimension
+        if self.weights is None:
+            matrix = KERNELS[self.edge_weight_type](self.prepared[:, None, :], self.prepared[None, :, :])
+        else:
+            matrix = np.zeros((n, n))
+            matrix[np.triu_indices(n, 1)] = self.weights
+            matrix += matrix.T
+        np.fill_diagonal(matrix, 0.0)
+        return matrix
+
+    def path_length(self, path):
+        path = np.asarray(path)
+        return float(self.distances(path[:-1], path[1:]).sum())
+
+    # Function returning d(a, b) for single cities, for loops that can't be vectorized
+    def distance_function(self):
+        if self.weights is not None:
+            n, weights = self.dimension, self.weights
+            def explicit(a, b):
+                if a == b:
+                    return 0.0
+                if a > b:
+                    a, b = b, a
+                return float(weights[a * n - a * (a + 1) // 2 + b - a - 1])
+            return explicit
+        return _scalar_kernel(self.edge_weight_type, self.prepared[:, 0].tolist(), self.prepared[:, 1].tolist())
+
+    # Function to find each city's k nearest cities: a KD-tree where the distance grows with the
+    # Euclidean one (GEO on the unit sphere), row by row for explicit matrices
+    def neighbor_lists(self, k=8):
+        n = self.dimension
+        k = min(k, n - 1)
+        if self.weights is None:
+            space = self.prepared
+            if self.edge_weight_type == "GEO":
+                lat, lon = space[:, 0], space[:, 1]
+                space = np.stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)], axis=1)
+            _, neighbors = cKDTree(space).query(space, k + 1)
+            return neighbors[:, 1:]
+        neighbors = np.empty((n, k), dtype=np.int64)
+        for start in range(0, n, 1024):
+            rows = np.arange(start, min(n, start + 1024))
+            block = self.distances(rows[:, None], np.arange(n)[None, :])
+            block[np.arange(len(rows)), rows] = np.inf
+            nearest = np.argpartition(block, k - 1, axis=1)[:, :k]
+            order = np.argsort(np.take_along_axis(block, nearest, axis=1), axis=1)
+            neighbors[rows] = np.take_along_axis(nearest, order, axis=1)
+        return neighbors
+
+    # Function to make an instance of some of the cities (coordinate types only)
+    def subset(self, cities):
+        if self.points is None:
+            raise ValueError("Explicit matrix instances have no coordinates to split")
+        return TSPInstance(self.name, self.edge_weight_type, self.points[cities])
+
+# Function to wrap a Coordinate list or array as an instance with the plain Euclidean distance
+def as_instance(coords):
+    if isinstance(coords, TSPInstance):
+        return coords
+    return TSPInstance("", "EUCLIDEAN", as_points(coords))
+
+# Row layouts of the EDGE_WEIGHT_FORMATs: entries per row and first column of each row.
+# The distances are symmetric, so a *_COL format is the transposed *_ROW one and stores the same triangle.
+def _explicit_layout(edge_weight_format, n):
+    rows = np.arange(n)
+    layouts = {
+        "FULL_MATRIX": (np.full(n, n), np.zeros(n, dtype=np.int64)),
+        "UPPER_ROW": (n - 1 - rows, rows + 1),
+        "UPPER_DIAG_ROW": (n - rows, rows),
+        "LOWER_ROW": (rows, np.zeros(n, dtype=np.int64)),
+        "LOWER_DIAG_ROW": (rows + 1, np.zeros(n, dtype=np.int64)),
+    }
+    transposed = {"LOWER_COL": "UPPER_ROW", "LOWER_DIAG_COL": "UPPER_DIAG_ROW", "UPPER_COL": "LOWER_ROW", "UPPER_DIAG_COL": "LOWER_DIAG_ROW"}
+    edge_weight_format = transposed.get(edge_weight_format, edge_weight_format)
+    if edge_weight_format not in layouts:
+        raise ValueError(f"Unsupported EDGE_WEIGHT_FORMAT: {edge_weight_format}")
+    return layouts[edge_weight_format]
+
+# Function to allocate the upper triangle, int32 since TSPLIB weights are integers (memory-mapped when large)
+def _new_weights(triangle, dtype, weights_dir):
+    if triangle <= EXPLICIT_MEMMAP_ENTRIES:
+        return np.zeros(triangle, dtype=dtype)
+    fd, weights_file = tempfile.mkstemp(suffix=".npy", dir=weights_dir)
+    os.close(fd)
+    try:
+        return np.lib.format.open_memmap(weights_file, mode="w+", dtype=dtype, shape=(triangle,))
+    except Exception:
+        os.unlink(weights_file)
+        raise
+
+# Function to delete the file behind a memory-mapped triangle (nothing to do for one in memory)
+def _delete_weights(weights):
+    if isinstance(weights, np.memmap):
+        try:
+            os.unlink(weights.filename)
+        except FileNotFoundError:
+            pass
+
+# Function to move the triangle to float64, for files whose weights turn out not to be int32 integers
+def _float_weights(weights, weights_dir):
+    converted = _new_weights(len(weights), np.float64, weights_dir)
+    for start in range(0, len(weights), 1 << 24):
+        converted[start:start + (1 << 24)] = weights[start:start + (1 << 24)]
+    _delete_weights(weights)
+    return converted
+
+def _fits_int32(values):
+    return bool((values == np.round(values)).all() and np.abs(values).max(initial=0) < 2 ** 31)
+
+# Function to put a chunk of EDGE_WEIGHT_SECTION values, starting at entry `first`, into the upper triangle
+# A full matrix lists both triangles, only the upper one is kept
+def _store_weights(weights, values, first, row_starts, first_columns, n, full):
+    entries = first + np.arange(len(values))
+    rows = np.searchsorted(row_starts, entries, side="right") - 1
+    cols = first_columns[rows] + entries - row_starts[rows]
+    keep = rows < cols if full else rows != cols
+    lo, hi = np.minimum(rows[keep], cols[keep]), np.maximum(rows[keep], cols[keep])
+    weights[condensed_index(n, lo, hi)] = values[keep]
+
+# Function to read a TSPLIB file with its EDGE_WEIGHT_TYPE (EUC_2D, CEIL_2D, ATT, GEO or EXPLICIT)
+# Explicit matrices are streamed into the upper triangle, memory-mapped in weights_dir when large.
+# Returns None (after printing why) if the file can't be read, like read_tsp_file.
+def read_tsp_instance(filename, weights_dir=None):
+    try:
+        return _read_tsp_instance(filename, weights_dir)
+    except FileNotFoundError:
+        print(f"Error: File {filename} not found.")
+    except Exception as e:
+        print(f"Error reading file: {e}")
+    return None
+
+def _read_tsp_instance(filename, weights_dir):
+    header = {}
+    coords = []
+    weights = None
+    try:
+        with open(filename, 'r') as file:
+            section = None
+            for line in file:
+                line = line.strip()
+                if not line or line == "EOF":
+                    continue
+                if line[0].isalpha():
+                    key = line.split(":")[0].strip()
+                    if key.endswith("_SECTION"):
+                        section = key
+                        if key == "EDGE_WEIGHT_SECTION":
+                            n = int(header["DIMENSION"])
+                            edge_weight_format = header.get("EDGE_WEIGHT_FORMAT", "FULL_MATRIX")
+                            lengths, first_columns = _explicit_layout(edge_weight_format, n)
+                            row_starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+                            total = int(lengths.sum())
+                            weights = _new_weights(n * (n - 1) // 2, np.int32, weights_dir)
+                            read, pending = 0, []
+                    else:
+                        header[key] = line.split(":", 1)[1].strip()
+                        section = None
+                elif section in ("NODE_COORD_SECTION", "DISPLAY_DATA_SECTION"):
+                    parts = line.split()
+                    coords.append((float(parts[1]), float(parts[2])))
+                elif section == "EDGE_WEIGHT_SECTION" and read < total:
+                    values = np.array(line.split(), dtype=float)[:total - read]
+                    pending.append(values)
+                    read += len(values)
+                    if read == total or sum(len(chunk) for chunk in pending) >= 1_000_000:
+                        chunk = np.concatenate(pending)
+                        if weights.dtype == np.int32 and not _fits_int32(chunk):
+                            weights = _float_weights(weights, weights_dir)
+                        _store_weights(weights, chunk, read - len(chunk), row_starts, first_columns, n, edge_weight_format == "FULL_MATRIX")
+                        pending = []
+
+        name = header.get("NAME", "")
+        dimension = int(header.get("DIMENSION", len(coords)))
+        edge_weight_type = header.get("EDGE_WEIGHT_TYPE", "EUC_2D")
+        if edge_weight_type != "EXPLICIT":
+            _delete_weights(weights)  # An EDGE_WEIGHT_SECTION the distance type doesn't use
+            return TSPInstance(name, edge_weight_type, np.array(coords[:dimension], dtype=float).reshape(-1, 2))
+        if weights is None or read < total:
+            raise ValueError("EDGE_WEIGHT_SECTION is missing or incomplete")
+        if isinstance(weights, np.memmap):
+            weights.flush()
+        points = np.array(coords[:dimension], dtype=float).reshape(-1, 2) if coords else None
+        instance = TSPInstance(name, edge_weight_type, points, weights, dimension)
+        if isinstance(weights, np.memmap):
+            instance.weights_owner = os.getpid()
+        return instance
+    except Exception:
+        # A half-read memory-mapped triangle would otherwise stay on disk
+        _delete_weights(weights)
+        raise
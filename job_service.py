@@ -0,0 +1,438 @@
+import os
+import sys
+import json
+import time
+import uuid
+import asyncio
+import hashlib
+import tempfile
+import multiprocessing as mp
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# The solvers live in the problem folders, make them importable here and in the worker processes
+ROOT = os.path.dirname(os.path.abspath(__file__))
+for folder in ("Traveling Salesman Problem(TSP)", "Knapsack Problem"):
+    if os.path.join(ROOT, folder) not in sys.path:
+        sys.path.insert(0, os.path.join(ROOT, folder))
+
+# Local batch job service: one long-running process takes jobs over HTTP (or a Unix socket) and runs them
+# on a bounded pool of worker processes, so no interpreter is started per job.
+#
+#   POST /jobs               {"problem": "tsp", "file": "...", "solver": "genetic", "options": {...}}
+#   GET  /jobs               every job with its status
+#   GET  /jobs/<id>          status and result of one job
+#   GET  /jobs/<id>/events   progress and the result, streamed as one JSON object per line
+#
+# Identical submissions (same problem, solver, options and file contents) share one job and its result.
+
+TSP_SOLVERS = ("nn_2opt", "genetic", "decompose", "exact")
+GAP_TIME_LIMIT = 60  # Seconds of subgradient steps for a job's lower bound
+KNAPSACK_SOLVERS = ("dynamic", "greedy")
+
+# Options a client may set for each solver and their types. workers and progress belong to the service.
+NUMBER = (int, float)
+SOLVER_OPTIONS = {
+    "nn_2opt": {"start_node": int, "gap": bool},
+    "genetic": {"islands": int, "population_size": int, "generations": int, "migration_interval": int, "migrants": int,
+                "mutation_rate": NUMBER, "seed": int, "time_limit": NUMBER, "gap": bool},
+    "decompose": {"region_size": int, "method": str, "repair_passes": int, "seed": int, "gap": bool},
+    "exact": {"time_limit": NUMBER},
+    "dynamic": {"capacity": int},
+    "greedy": {"capacity": int},
+}
+
+# Function to reject options a solver doesn't take before they reach it as keyword arguments
+def check_options(solver, options):
+    if not isinstance(options, dict):
+        raise ValueError("options must be a JSON object")
+    allowed = SOLVER_OPTIONS[solver]
+    for name, value in options.items():
+        if name not in allowed:
+            raise ValueError(f"Unknown option {name!r} for solver {solver!r}, allowed: {', '.join(sorted(allowed))}")
+        # bool is an int in Python, only let it through where a bool is expected
+        if not isinstance(value, allowed[name]) or (isinstance(value, bool) and allowed[name] is not bool):
+            raise ValueError(f"Option {name!r} has the wrong type: {value!r}")
+
+# Progress queue of this worker process, set by the pool initializer
+_progress_queue = None
+
+def _init_worker(progress_queue):
+    global _progress_queue
+    _progress_queue = progress_queue
+
+def _report(job_id, event, **data):
+    if _progress_queue is not None:
+        _progress_queue.put({"job": job_id, "event": event, "time": time.time(), **data})
+
+# Function to solve one TSP instance with the chosen solver (runs in a worker process)
+def solve_tsp(job_id, filename, solver, options):
+    from tsplib import read_tsp_instance
+
+    # "gap": false skips the Held-Karp bound, every other option goes to the solver
+    options = dict(options)
+    report_gap = options.pop("gap", True)
+    instance = read_tsp_instance(filename)
+    if instance is None or len(instance) == 0:
+        raise ValueError(f"Could not read a TSP instance from {filename}")
+    # Leaving the block deletes a memory-mapped distance matrix, the worker process outlives the job
+    with instance:
+        return _solve_tsp_instance(job_id, instance, solver, options, report_gap)
+
+def _solve_tsp_instance(job_id, instance, solver, options, report_gap):
+    from tsplib import nearest_neighbor
+    from local_search import two_opt
+    from lower_bound import tour_gap, certified_gap
+
+    _report(job_id, "progress", stage="loaded", dimension=len(instance))
+    result = {"name": instance.name, "dimension": len(instance), "edge_weight_type": instance.edge_weight_type}
+    # The pool already uses every core, so the solvers run single-process inside a job
+    if solver == "nn_2opt":
+        _, path = nearest_neighbor(instance, options.get("start_node", 0))
+        distance, path = two_opt(instance, path)
+    elif solver == "genetic":
+        from genetic import genetic_algorithm
+        progress = lambda epoch, epochs, best: _report(job_id, "progress", epoch=epoch, epochs=epochs, best_distance=best)
+        distance, path = genetic_algorithm(instance, workers=1, progress=progress, **options)
+    elif solver == "decompose":
+        from decompose import decomposition_solve
+        distance, path = decomposition_solve(instance, workers=1, **options)
+    elif solver == "exact":
+        from exact import solve_exact
+        distance, path, lower_bound = solve_exact(instance, **options)
+        result["lower_bound"] = lower_bound
+    else:
+        raise ValueError(f"Unknown TSP solver: {solver}")
+    if solver == "exact":
+        result["gap"] = certified_gap(distance, result["lower_bound"])
+    elif report_gap:
+        _report(job_id, "progress", stage="bounding", distance=distance)
+        result["lower_bound"], result["gap"] = tour_gap(instance, distance, time_limit=GAP_TIME_LIMIT)
+    result.update(distance=distance, path=path)
+    return result
+
+# Function to solve one knapsack dataset with the chosen solver (runs in a worker process)
+def solve_knapsack(job_id, filename, solver, options):
+    from dynamic import read_input
+
+    knapsack_capacity, total_items, items = read_input(filename)
+    knapsack_capacity = options.get("capacity", knapsack_capacity)
+    _report(job_id, "progress", stage="loaded", items=total_items)
+    if solver == "dynamic":
+        from knapsack_solver import KnapsackSolver
+        value = KnapsackSolver(items, total_items, knapsack_capacity).best_value(knapsack_capacity)
+        return {"capacity": knapsack_capacity, "items": total_items, "value": value}
+    if solver == "greedy":
+        from heuristics import critical_item_greedy
+        value, selected = critical_item_greedy(items, total_items, knapsack_capacity)
+        return {"capacity": knapsack_capacity, "items": total_items, "value": int(value), "selected": selected}
+    raise ValueError(f"Unknown knapsack solver: {solver}")
+
+# Function run by the pool for every job
+# The solver reads the file again, so its contents are checked against the digest the job's key was made from,
+# before and after, or a file edited in between would get its result cached under the old contents
+def run_job(job_id, problem, filename, digest, solver, options):
+    _report(job_id, "started")
+    check_file(filename, digest)
+    solve = solve_tsp if problem == "tsp" else solve_knapsack
+    result = solve(job_id, filename, solver, options)
+    check_file(filename, digest)
+    return result
+
+# Function to hash a file's contents
+def file_digest(filename):
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def check_file(filename, digest):
+    if file_digest(filename) != digest:
+        raise ValueError(f"{filename} changed after the job was submitted, submit it again")
+
+# Function to hash a submission, the key identical submissions share in the result cache
+def job_key(problem, digest, solver, options):
+    settings = json.dumps([problem, solver, options], sort_keys=True)
+    return hashlib.sha256(digest.encode() + settings.encode()).hexdigest()
+
+# A submitted job, its events are kept so late listeners get the whole stream
+class Job:
+    def __init__(self, job_id, key, digest, problem, filename, solver, options):
+        self.id = job_id
+        self.key = key
+        self.digest = digest
+        self.problem = problem
+        self.filename = filename
+        self.solver = solver
+        self.options = options
+        self.status = "queued"
+        self.result = None
+        self.error = None
+        self.events = []
+        self.changed = asyncio.Condition()
+
+    def summary(self, with_result=True):
+        summary = {"id": self.id, "problem": self.problem, "file": self.filename, "solver": self.solver,
+                   "options": self.options, "status": self.status}
+        if with_result:
+            summary.update(result=self.result, error=self.error)
+        return summary
+
+    async def add_event(self, event):
+        async with self.changed:
+            self.events.append(event)
+            self.changed.notify_all()
+
+    def finished(self):
+        return self.status in ("done", "failed")
+
+# The service: job table, result cache and the bounded worker pool
+class JobService:
+    def __init__(self, workers=None, max_queued=1000, cache_dir=None, max_finished=200):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queued = max_queued
+        self.max_finished = max_finished
+        self.cache_dir = cache_dir
+        self.jobs = {}
+        self.by_key = {}
+        self.finished_jobs = deque()  # Ids of finished jobs, oldest first
+        # Spawned rather than forked workers, a fork would inherit the open client sockets and keep them from closing
+        self.context = mp.get_context("spawn")
+        self.progress_queue = self.context.Queue()
+        self.pool = self.new_pool()
+        # Only as many jobs as workers are handed to the pool, the rest wait here and stay cancellable
+        self.slots = asyncio.Semaphore(self.workers)
+        self.tasks = set()
+
+    def new_pool(self):
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=self.context, initializer=_init_worker, initargs=(self.progress_queue,))
+
+    # A worker that dies (killed, out of memory, crash in native code) breaks the whole pool: every job on it
+    # fails with BrokenProcessPool. Those jobs are lost, but a fresh pool takes the ones still waiting.
+    def replace_pool(self, broken):
+        if self.pool is broken:
+            self.pool = self.new_pool()
+            broken.shutdown(wait=False, cancel_futures=True)
+
+    # Function to record a finished job and forget the oldest finished ones past max_finished
+    # Results (whole 100K city paths) would otherwise pile up in memory, the disk cache keeps them for resubmissions
+    def retire(self, job):
+        self.finished_jobs.append(job.id)
+        while len(self.finished_jobs) > self.max_finished:
+            old = self.jobs.pop(self.finished_jobs.popleft(), None)
+            if old is not None and self.by_key.get(old.key) == old.id:
+                del self.by_key[old.key]
+
+    # Function to accept a submission, returns (job, True if it was already known)
+    async def submit(self, problem, filename, solver, options):
+        for field, value in (("problem", problem), ("file", filename), ("solver", solver)):
+            if not isinstance(value, str):
+                raise ValueError(f"{field} must be a string, got {value!r}")
+        if problem not in ("tsp", "knapsack"):
+            raise ValueError(f"Unknown problem: {problem!r}")
+        if solver not in (TSP_SOLVERS if problem == "tsp" else KNAPSACK_SOLVERS):
+            raise ValueError(f"Unknown solver {solver!r} for problem {problem!r}")
+        check_options(solver, options)
+        filename = os.path.abspath(filename)
+        digest = await asyncio.to_thread(file_digest, filename)
+        key = job_key(problem, digest, solver, options)
+
+        if key in self.by_key and self.jobs[self.by_key[key]].status != "failed":
+            return self.jobs[self.by_key[key]], True
+        if sum(not job.finished() for job in self.jobs.values()) >= self.max_queued:
+            raise OverflowError("Job queue is full, try again later")
+
+        job = Job(uuid.uuid4().hex[:12], key, digest, problem, filename, solver, options)
+        self.jobs[job.id] = job
+        self.by_key[key] = job.id
+        cached = await asyncio.to_thread(self.load_cached, key)
+        if cached is not None:
+            job.status, job.result = "done", cached
+            await job.add_event({"job": job.id, "event": "done", "time": time.time(), "cached": True, "result": cached})
+            self.retire(job)
+            return job, True
+        await job.add_event({"job": job.id, "event": "queued", "time": time.time()})
+        task = asyncio.create_task(self.run(job))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return job, False
+
+    async def run(self, job):
+        async with self.slots:
+            loop = asyncio.get_running_loop()
+            pool = self.pool
+            try:
+                job.result = await loop.run_in_executor(pool, run_job, job.id, job.problem, job.filename, job.digest, job.solver, job.options)
+                job.status = "done"
+                await asyncio.to_thread(self.save_cached, job.key, job.result)
+                await job.add_event({"job": job.id, "event": "done", "time": time.time(), "result": job.result})
+            except BrokenProcessPool:
+                self.replace_pool(pool)
+                job.status, job.error = "failed", "BrokenProcessPool: a worker process died while the job was running"
+                await job.add_event({"job": job.id, "event": "failed", "time": time.time(), "error": job.error})
+            except Exception as e:
+                job.status, job.error = "failed", f"{type(e).__name__}: {e}"
+                await job.add_event({"job": job.id, "event": "failed", "time": time.time(), "error": job.error})
+            self.retire(job)
+
+    # Progress from the workers arrives on a multiprocessing queue, read it off the event loop
+    async def forward_progress(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            event = await loop.run_in_executor(None, self.progress_queue.get)
+            if event is None:
+                break
+            job = self.jobs.get(event["job"])
+            # The result can come back through the pool before the job's last progress events, drop those
+            if job is not None and not job.finished():
+                if event["event"] == "started":
+                    job.status = "running"
+                await job.add_event(event)
+
+    # Results cached on disk survive a restart, written atomically like the other caches
+    # Plain file I/O, the event loop calls these through asyncio.to_thread
+    def cache_path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def load_cached(self, key):
+        if self.cache_dir is None or not os.path.exists(self.cache_path(key)):
+            return None
+        with open(self.cache_path(key), 'r') as file:
+            return json.load(file)
+
+    def save_cached(self, key, result):
+        if self.cache_dir is None:
+            return
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-")
+        with os.fdopen(fd, 'w') as file:
+            json.dump(result, file)
+        os.replace(tmp_path, self.cache_path(key))
+
+    async def events(self, job):
+        # Replay what happened so far, then wait for more until the job finishes
+        sent = 0
+        while True:
+            async with job.changed:
+                await job.changed.wait_for(lambda: len(job.events) > sent)
+                new_events = job.events[sent:]
+            sent += len(new_events)
+            for event in new_events:
+                yield event
+            if new_events[-1]["event"] in ("done", "failed"):
+                return
+
+    def shutdown(self):
+        self.progress_queue.put(None)
+        self.pool.shutdown(cancel_futures=True)
+
+# Minimal HTTP/1.1 handling on top of asyncio streams, one request per connection
+async def read_request(reader):
+    request_line = (await reader.readline()).decode().strip()
+    if not request_line:
+        return None
+    method, target, _ = request_line.split(" ", 2)
+    headers = {}
+    while True:
+        line = (await reader.readline()).decode().strip()
+        if not line:
+            break
+        name, value = line.split(":", 1)
+        headers[name.strip().lower()] = value.strip()
+    body = await reader.readexactly(int(headers.get("content-length", 0)))
+    return method, target, body
+
+async def send_json(writer, status, payload):
+    reasons = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 503: "Service Unavailable"}
+    body = json.dumps(payload).encode()
+    writer.write(f"HTTP/1.1 {status} {reasons[status]}\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body)
+    await writer.drain()
+
+# Events go out as chunked NDJSON so clients can read them as they come
+async def stream_events(writer, service, job):
+    writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\nTransfer-Encoding: chunked\r\nConnection: close\r\n\r\n")
+    async for event in service.events(job):
+        line = json.dumps(event).encode() + b"\n"
+        writer.write(f"{len(line):x}\r\n".encode() + line + b"\r\n")
+        await writer.drain()
+    writer.write(b"0\r\n\r\n")
+    await writer.drain()
+
+async def handle_connection(service, reader, writer):
+    try:
+        try:
+            request = await read_request(reader)
+        except ValueError:
+            # Bad request line, header or Content-Length (or not UTF-8)
+            await send_json(writer, 400, {"error": "Malformed HTTP request"})
+            return
+        if request is None:
+            return
+        method, target, body = request
+        parts = [part for part in target.split("?")[0].split("/") if part]
+        if parts == ["jobs"] and method == "POST":
+            try:
+                payload = json.loads(body or b"{}")
+                if not isinstance(payload, dict):
+                    raise ValueError("Request body must be a JSON object")
+                job, known = await service.submit(payload.get("problem", "tsp"), payload["file"], payload.get("solver", "nn_2opt"), payload.get("options", {}))
+            except OverflowError as e:
+                await send_json(writer, 503, {"error": str(e)})
+                return
+            except (KeyError, ValueError, OSError) as e:
+                await send_json(writer, 400, {"error": f"{type(e).__name__}: {e}"})
+                return
+            await send_json(writer, 200 if known else 201, {**job.summary(), "duplicate": known})
+        elif parts == ["jobs"] and method == "GET":
+            await send_json(writer, 200, [job.summary(with_result=False) for job in service.jobs.values()])
+        elif len(parts) in (2, 3) and parts[0] == "jobs" and method == "GET":
+            job = service.jobs.get(parts[1])
+            if job is None:
+                await send_json(writer, 404, {"error": f"No job {parts[1]}"})
+            elif len(parts) == 3 and parts[2] == "events":
+                await stream_events(writer, service, job)
+            elif len(parts) == 2:
+                await send_json(writer, 200, job.summary())
+            else:
+                await send_json(writer, 404, {"error": f"Unknown path {target}"})
+        elif parts and parts[0] == "jobs":
+            await send_json(writer, 405, {"error": f"{method} not allowed on {target}"})
+        else:
+            await send_json(writer, 404, {"error": f"Unknown path {target}"})
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass  # Client went away
+    finally:
+        writer.close()
+
+# Function to run the service until interrupted, on TCP or on a Unix socket if a path is given
+async def serve(host="127.0.0.1", port=8765, unix_path=None, workers=None, cache_dir=None):
+    service = JobService(workers, cache_dir=cache_dir)
+    forwarder = asyncio.create_task(service.forward_progress())
+    handler = lambda reader, writer: handle_connection(service, reader, writer)
+    if unix_path:
+        server = await asyncio.start_unix_server(handler, path=unix_path)
+        print(f"Serving on {unix_path} with {service.workers} workers")
+    else:
+        server = await asyncio.start_server(handler, host, port)
+        print(f"Serving on http://{host}:{port} with {service.workers} workers")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.shutdown()
+        await forwarder
+
+# Main program
+if __name__ == "__main__":
+    unix_path = input("Enter a Unix socket path (leave empty for TCP): ").strip() or None
+    port = 8765 if unix_path else int(input("Enter port (default 8765): ") or 8765)
+    workers = int(input("Enter number of workers (default all cores): ") or 0) or None
+    cache_dir = input("Enter result cache directory (leave empty for memory only): ").strip() or None
+
+    try:
+        asyncio.run(serve(port=port, unix_path=unix_path, workers=workers, cache_dir=cache_dir))
+    except KeyboardInterrupt:
+        print("Stopped.")